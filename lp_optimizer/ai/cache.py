@@ -0,0 +1,173 @@
+"""Response cache for AI formulation results"""
+
+import hashlib
+import os
+import pickle
+import re
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
+
+from ..config import (
+    FORMULATION_CACHE_SIZE,
+    FORMULATION_CACHE_DIR,
+    SEMANTIC_SIMILARITY_THRESHOLD,
+)
+from ..utils.logger import get_logger
+
+# Get logger for this module
+logger = get_logger("ai.cache")
+
+# Collapse runs of whitespace when normalizing problem descriptions
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_description(problem_description: str) -> str:
+    """Normalize a problem description for cache lookups"""
+    return _WHITESPACE_RE.sub(" ", problem_description.strip().lower())
+
+
+def make_cache_key(model: str, temperature: float, normalized_description: str) -> str:
+    """Build the exact-match cache key from model, temperature, and text"""
+    payload = f"{model}|{temperature}|{normalized_description}"
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _to_plain(result: Dict) -> Dict:
+    """Unwrap a (possibly read-only) result into picklable plain dicts"""
+    plain = dict(result)
+    raw = plain.get("raw_result")
+    if raw is not None:
+        plain["raw_result"] = dict(raw)
+    return plain
+
+
+def _to_shared(result: Dict) -> Dict:
+    """Re-wrap a loaded result as the read-only mapping callers expect"""
+    entry = dict(result)
+    raw = entry.get("raw_result")
+    if raw is not None:
+        entry["raw_result"] = MappingProxyType(dict(raw))
+    return MappingProxyType(entry)
+
+
+class LPCache:
+    """
+    Two-tier cache for LP formulation results.
+
+    Tier 1 is an exact-match LRU keyed by SHA-256 of the normalized problem
+    text. Tier 2 is a semantic match over stored embeddings: a lookup hits
+    when the cosine similarity with a stored embedding reaches the
+    configured threshold. The cache can persist itself to disk (one pickle
+    file per model name) so results survive restarts.
+    """
+
+    def __init__(self, model_name: str, max_entries: int = FORMULATION_CACHE_SIZE):
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self._exact: "OrderedDict[str, Dict]" = OrderedDict()
+        self._semantic: List[Tuple[List[float], Dict]] = []
+        self._cache_path = (
+            os.path.join(FORMULATION_CACHE_DIR, f"{model_name}.pkl")
+            if FORMULATION_CACHE_DIR
+            else None
+        )
+        self._load()
+
+    def get_exact(self, key: str) -> Optional[Dict]:
+        """Look up a result by exact cache key"""
+        result = self._exact.get(key)
+        if result is not None:
+            self._exact.move_to_end(key)
+            logger.info("Exact cache hit")
+        return result
+
+    def get_semantic(self, embedding: List[float]) -> Optional[Dict]:
+        """Look up a result by embedding cosine similarity"""
+        if not self._semantic:
+            return None
+
+        import numpy as np
+
+        query = np.asarray(embedding, dtype=float)
+        query_norm = np.linalg.norm(query)
+        if query_norm == 0:
+            return None
+
+        best_score = 0.0
+        best_result = None
+        for stored_embedding, result in self._semantic:
+            stored = np.asarray(stored_embedding, dtype=float)
+            stored_norm = np.linalg.norm(stored)
+            if stored_norm == 0:
+                continue
+            score = float(np.dot(query, stored) / (query_norm * stored_norm))
+            if score > best_score:
+                best_score = score
+                best_result = result
+
+        if best_score >= SEMANTIC_SIMILARITY_THRESHOLD:
+            logger.info(f"Semantic cache hit (similarity={best_score:.3f})")
+            return best_result
+        return None
+
+    def put(self, key: str, result: Dict, embedding: Optional[List[float]] = None):
+        """Store a result under its exact key and optional embedding"""
+        self._exact[key] = result
+        self._exact.move_to_end(key)
+        while len(self._exact) > self.max_entries:
+            self._exact.popitem(last=False)
+
+        if embedding is not None:
+            self._semantic.append((list(embedding), result))
+            if len(self._semantic) > self.max_entries:
+                self._semantic.pop(0)
+
+        self._save()
+
+    def _load(self):
+        """Load persisted cache entries from disk if available"""
+        if not self._cache_path or not os.path.exists(self._cache_path):
+            return
+        try:
+            with open(self._cache_path, "rb") as f:
+                data = pickle.load(f)
+            # Entries are persisted as plain dicts; restore the read-only
+            # wrapping that callers rely on
+            self._exact = OrderedDict(
+                (key, _to_shared(result))
+                for key, result in data.get("exact", {}).items()
+            )
+            self._semantic = [
+                (embedding, _to_shared(result))
+                for embedding, result in data.get("semantic", [])
+            ]
+            logger.info(
+                f"Loaded {len(self._exact)} cached formulations for {self.model_name}"
+            )
+        except Exception as e:
+            logger.warning(f"Could not load formulation cache: {e}")
+
+    def _save(self):
+        """Persist cache entries to disk if a cache directory is configured"""
+        if not self._cache_path:
+            return
+        try:
+            os.makedirs(FORMULATION_CACHE_DIR, exist_ok=True)
+            # mappingproxy objects cannot be pickled - persist plain dicts
+            with open(self._cache_path, "wb") as f:
+                pickle.dump(
+                    {
+                        "exact": {
+                            key: _to_plain(result)
+                            for key, result in self._exact.items()
+                        },
+                        "semantic": [
+                            (embedding, _to_plain(result))
+                            for embedding, result in self._semantic
+                        ],
+                    },
+                    f,
+                )
+        except Exception as e:
+            logger.warning(f"Could not persist formulation cache: {e}")
@@ -1,58 +1,217 @@
 """Gemini-based LP problem formulator"""
 
+import functools
 import os
 import json
+import re
+import threading
+import time
+from types import MappingProxyType
 from typing import Dict, List, Optional
-from pydantic import BaseModel, Field
-from google import genai
+
+# orjson parses JSON several times faster than the stdlib; fall back to
+# the stdlib when it is not installed
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+except ImportError:
+    _loads = json.loads
 
 from .prompts import SYSTEM_PROMPT, EXAMPLE_PROBLEMS
+from .cache import LPCache, normalize_description, make_cache_key
 from ..config import (
     GEMINI_MODEL,
     GEMINI_API_KEY,
     GEMINI_TEMPERATURE,
     GEMINI_MAX_TOKENS,
+    GEMINI_THINKING_BUDGET,
+    GEMINI_EMBEDDING_MODEL,
 )
 from ..utils.logger import get_logger
 
 # Get logger for this module
 logger = get_logger("ai.formulator")
 
+# Shared Gemini clients keyed by API key so HTTP connection pools, TLS
+# sessions, and DNS lookups are reused across LPFormulator instances
+_CLIENT_CACHE: Dict[str, object] = {}
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client(api_key: str, http_options=None):
+    """Get or create the shared Gemini client for an API key"""
+    # Imported lazily: google.genai drags in its HTTP stack, which is
+    # wasted cost for processes that never formulate a problem
+    from google import genai
+
+    with _CLIENT_LOCK:
+        client = _CLIENT_CACHE.get(api_key)
+        if client is None:
+            logger.debug("Creating new shared Gemini client")
+            if http_options is not None:
+                client = genai.Client(api_key=api_key, http_options=http_options)
+            else:
+                client = genai.Client(api_key=api_key)
+            _CLIENT_CACHE[api_key] = client
+        return client
+
+
+# Static prompt prefix - byte-identical across requests. All static content
+# comes first and the user's problem is appended last, so the prefix can be
+# registered with Gemini's context cache and its tokens reused server-side.
+# The output shape is enforced by response_schema, not prompt instructions.
+_STATIC_PREFIX = f"""{SYSTEM_PROMPT}
+
+Here are some examples:
+
+Example 1:
+Problem: {EXAMPLE_PROBLEMS[0]['description']}
+
+Formulation: {json.dumps(EXAMPLE_PROBLEMS[0]['formulation'])}
+
+Example 2:
+Problem: {EXAMPLE_PROBLEMS[1]['description']}
+
+Formulation: {json.dumps(EXAMPLE_PROBLEMS[1]['formulation'])}
+
+Now formulate this problem:
+
+"""
+
+@functools.lru_cache(maxsize=256)
+def _build_prompt(problem_description: str) -> str:
+    """Assemble the full inline prompt, memoized per problem description"""
+    return _STATIC_PREFIX + problem_description
+
+
+# How long the server-side context cache stays warm
+_CONTEXT_CACHE_TTL = "3600s"
+
+# Seconds between batch job status polls
+_BATCH_POLL_SECONDS = 2.0
+
+# Extracts a JSON object from a response in one pass, whether or not it is
+# wrapped in a markdown code fence (only needed when schema output misfires)
+_JSON_RE = re.compile(r"```json\s*(\{.*\})\s*```|(\{.*\})", re.DOTALL)
+
+# Rough token budget per item in the structured formulation payload
+_TOKENS_BASE = 200
+_TOKENS_PER_VARIABLE = 30
+_TOKENS_PER_CONSTRAINT = 40
+
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+
+# Pro-class models cannot disable thinking; 128 is the smallest budget
+# the API accepts for them
+_PRO_MIN_THINKING_BUDGET = 128
+
+
+def _effective_thinking_budget() -> int:
+    """Thinking budget clamped to what the configured model accepts
+
+    Flash-class models allow a budget of 0 (no thinking pass); Pro models
+    reject 0 with INVALID_ARGUMENT, so the configured value is raised to
+    their minimum there.
+    """
+    if GEMINI_THINKING_BUDGET == 0 and "pro" in GEMINI_MODEL:
+        return _PRO_MIN_THINKING_BUDGET
+    return GEMINI_THINKING_BUDGET
+
+
+def _estimate_max_tokens(problem_description: str) -> int:
+    """Estimate an output-token ceiling from the problem's apparent size"""
+    # Nearly every constraint in a problem statement mentions a number, so
+    # the numeric-clause count is a cheap upper bound on constraints; the
+    # variable count is typically a fraction of that. Thinking tokens count
+    # against max_output_tokens, so the budget is added on top.
+    numbers = len(_NUMBER_RE.findall(problem_description))
+    estimate = (
+        _TOKENS_BASE
+        + _TOKENS_PER_VARIABLE * max(2, numbers // 3)
+        + _TOKENS_PER_CONSTRAINT * max(2, numbers)
+        + max(0, _effective_thinking_budget())
+    )
+    return min(GEMINI_MAX_TOKENS, estimate)
+
+
+# Pydantic model for structured output, defined on first use so importing
+# this module does not pay pydantic's import and schema-compilation cost
+_FORMULATION_SCHEMA = None
 
-# Pydantic models for structured output
-class LPFormulation(BaseModel):
-    """Linear Programming formulation structure"""
-    variables: List[str] = Field(description="List of decision variable names")
-    variable_descriptions: Dict[str, str] = Field(description="Description of each variable")
-    objective_type: str = Field(description="Either 'maximize' or 'minimize'", pattern="^(maximize|minimize)$")
-    objective_function: str = Field(description="The objective function expression (without Max/Min prefix)")
-    constraints: List[str] = Field(description="List of constraint expressions")
-    constraint_descriptions: Dict[str, str] = Field(description="Description of each constraint")
-    explanation: str = Field(description="Brief explanation of the formulation")
+
+def _get_formulation_schema():
+    """Get the LPFormulation response schema, defining it on first use"""
+    global _FORMULATION_SCHEMA
+    if _FORMULATION_SCHEMA is None:
+        from pydantic import BaseModel, Field
+
+        class LPFormulation(BaseModel):
+            """Linear Programming formulation structure (Gemini response schema)"""
+            variables: List[str] = Field(description="List of decision variable names")
+            variable_descriptions: Dict[str, str] = Field(description="Description of each variable")
+            objective_type: str = Field(description="Either 'maximize' or 'minimize'", pattern="^(maximize|minimize)$")
+            objective_function: str = Field(description="The objective function expression (without Max/Min prefix)")
+            constraints: List[str] = Field(description="List of constraint expressions")
+            constraint_descriptions: Dict[str, str] = Field(description="Description of each constraint")
+            explanation: str = Field(description="Brief explanation of the formulation")
+
+        _FORMULATION_SCHEMA = LPFormulation
+
+    return _FORMULATION_SCHEMA
+
+
+@functools.lru_cache(maxsize=1)
+def _get_base_config():
+    """Frozen base generation config, built once on first request"""
+    return MappingProxyType({
+        "temperature": GEMINI_TEMPERATURE,
+        "top_p": 0.95,
+        "max_output_tokens": GEMINI_MAX_TOKENS,
+        # Native structured output: the model returns typed JSON directly,
+        # with no markdown fences to strip on our side
+        "response_mime_type": "application/json",
+        "response_schema": _get_formulation_schema(),
+        # Formulation is short and well-templated; keeping the thinking
+        # pass minimal saves a large share of wall-clock per call (clamped
+        # to the model's smallest accepted budget)
+        "thinking_config": {"thinking_budget": _effective_thinking_budget()},
+    })
 
 
 class LPFormulator:
     """Convert natural language problems to LP format using Gemini"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, http_options=None):
         """Initialize the Gemini client with API key"""
         # Allow override from parameter, environment, or use config default
         self.api_key = (
-            api_key 
-            or os.getenv("GEMINI_API_KEY") 
+            api_key
+            or os.getenv("GEMINI_API_KEY")
             or os.getenv("GOOGLE_API_KEY")
             or GEMINI_API_KEY
         )
-        
+
         if not self.api_key:
             raise ValueError(
                 "Gemini API key not found. Please set GEMINI_API_KEY or GOOGLE_API_KEY environment variable."
             )
 
-        # Initialize client with API key
-        self.client = genai.Client(api_key=self.api_key)
+        # Reuse the shared client so connection pools persist across instances.
+        # Pass http_options (genai.types.HttpOptions) to supply a custom pool.
+        self.client = _get_client(self.api_key, http_options)
         self.model = GEMINI_MODEL
 
+        # Response cache - cache keys include the temperature, so each
+        # (model, temperature, description) triple reuses its own sampled
+        # completion; a repeated prompt never pays a second API call
+        self.cache = LPCache(self.model)
+
+        # Server-side context cache for the static prompt prefix
+        self._context_cache_name = None
+        self._context_cache_failed = False
+
     def formulate_problem(self, problem_description: str) -> Dict:
         """
         Convert natural language problem description to LP format
@@ -65,129 +224,318 @@ class LPFormulator:
         """
         try:
             logger.info("Starting problem formulation")
-            logger.debug(f"Problem description length: {len(problem_description)} chars")
-            
-            # Build the prompt
-            prompt = self._build_prompt(problem_description)
-            logger.debug(f"Built prompt with length: {len(prompt)} chars")
-            
-            # Generate content - use simple JSON format
-            json_structure = {
-                "variables": ["x1", "x2"],
-                "variable_descriptions": {"x1": "...", "x2": "..."},
-                "objective_type": "maximize or minimize",
-                "objective_function": "objective expression without Max/Min prefix",
-                "constraints": ["constraint1", "constraint2"],
-                "constraint_descriptions": {"constraint1": "...", "constraint2": "..."},
-                "explanation": "brief explanation"
-            }
-            
-            json_prompt = prompt + "\n\nReturn the formulation as a JSON object with this structure:\n" + json.dumps(json_structure, indent=2)
-            logger.debug(f"Full prompt length: {len(json_prompt)} chars")
-            
-            logger.info(f"Calling Gemini API with model: {self.model}")
+            logger.debug("Problem description length: %d chars", len(problem_description))
+
+            # Check the response cache before paying for an API call
+            cached, cache_key, embedding = self._check_cache(problem_description)
+            if cached is not None:
+                return cached
+
+            # Build the request, reusing the cached prefix when available
+            contents, config = self._prepare_request(problem_description)
+
+            logger.info("Calling Gemini API with model: %s", self.model)
+            stream = getattr(self.client.models, "generate_content_stream", None)
+            if stream is not None:
+                # Stream chunks so accumulation overlaps network I/O instead
+                # of waiting for the last token before any processing starts
+                parts = []
+                for chunk in stream(
+                    model=self.model,
+                    contents=contents,
+                    config=config,
+                ):
+                    if chunk.text:
+                        parts.append(chunk.text)
+                logger.info("Received streamed response from Gemini API")
+                return self._handle_json_text("".join(parts), cache_key, embedding)
+
+            # SDK without streaming support - buffer the full response
             response = self.client.models.generate_content(
                 model=self.model,
-                contents=json_prompt,
-                config={
-                    "temperature": GEMINI_TEMPERATURE,
-                    "top_p": 0.95,
-                    "max_output_tokens": GEMINI_MAX_TOKENS,
-                }
+                contents=contents,
+                config=config,
             )
             logger.info("Received response from Gemini API")
-            
-            # Parse the response
-            # Extract JSON from the response text
-            response_text = response.text.strip()
-            logger.debug(f"Response text length: {len(response_text)} chars")
-            
-            # Find JSON content (might be wrapped in markdown code blocks)
-            if '```json' in response_text:
-                logger.debug("Found JSON in markdown code block")
-                start = response_text.find('```json') + 7
-                end = response_text.find('```', start)
-                json_text = response_text[start:end].strip()
-            elif '{' in response_text:
-                logger.debug("Found raw JSON object")
-                # Find the JSON object
-                start = response_text.find('{')
-                end = response_text.rfind('}') + 1
-                json_text = response_text[start:end]
-            else:
-                logger.debug("Using entire response as JSON")
-                json_text = response_text
-            
-            logger.debug(f"Attempting to parse JSON of length: {len(json_text)} chars")
-            result_dict = json.loads(json_text)
-            logger.info("Successfully parsed JSON response")
-            
-            # Convert to our expected format
-            formatted_result = self._format_result(result_dict)
-            logger.info(f"Formulation successful: {formatted_result.get('success', False)}")
-            
-            return formatted_result
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"JSON parsing error: {e}")
-            logger.debug(f"Failed to parse: {json_text[:200] if 'json_text' in locals() else 'N/A'}...")
+
+            return self._handle_response(response, cache_key, embedding)
+
+        except Exception as e:
+            logger.error(f"Formulation error: {e}", exc_info=True)
             return {
-                "error": f"Failed to parse AI response as JSON: {str(e)}",
+                "error": f"Failed to formulate problem: {str(e)}",
                 "success": False
             }
+
+    async def aformulate_problem(self, problem_description: str) -> Dict:
+        """
+        Async variant of formulate_problem for coroutine-based workflows
+
+        Uses the shared client's async path so a single HTTP session is
+        reused across concurrent formulations.
+
+        Args:
+            problem_description: Natural language description of the problem
+
+        Returns:
+            Dictionary with LP formulation or error information
+        """
+        try:
+            logger.info("Starting async problem formulation")
+
+            cached, cache_key, embedding = self._check_cache(problem_description)
+            if cached is not None:
+                return cached
+
+            contents, config = self._prepare_request(problem_description)
+
+            logger.info("Calling Gemini API (async) with model: %s", self.model)
+            response = await self.client.aio.models.generate_content(
+                model=self.model,
+                contents=contents,
+                config=config,
+            )
+            logger.info("Received response from Gemini API")
+
+            return self._handle_response(response, cache_key, embedding)
+
         except Exception as e:
             logger.error(f"Formulation error: {e}", exc_info=True)
             return {
                 "error": f"Failed to formulate problem: {str(e)}",
                 "success": False
             }
-    
-    def _build_prompt(self, problem_description: str) -> str:
-        """Build the prompt with system instructions and examples"""
-        # Create prompt content
-        prompt = f"""{SYSTEM_PROMPT}
 
-Here are some examples:
+    def formulate_problems(self, problem_descriptions: List[str]) -> List[Dict]:
+        """
+        Formulate several problems in one Gemini batch submission
 
-Example 1:
-Problem: {EXAMPLE_PROBLEMS[0]['description']}
+        Cache hits are served locally; only misses are sent to the Batch
+        API, so N problems cost one HTTP exchange instead of N round trips.
+        Falls back to sequential formulate_problem calls if the batch
+        endpoint is unavailable.
 
-Formulation: {EXAMPLE_PROBLEMS[0]['formulation']}
+        Args:
+            problem_descriptions: Natural language problem descriptions
 
-Example 2:
-Problem: {EXAMPLE_PROBLEMS[1]['description']}
+        Returns:
+            List of formulation dictionaries, one per description, in order
+        """
+        results: List[Optional[Dict]] = [None] * len(problem_descriptions)
 
-Formulation: {EXAMPLE_PROBLEMS[1]['formulation']}
+        # Serve cache hits locally; collect the misses for the batch
+        pending = []
+        for i, description in enumerate(problem_descriptions):
+            cached, cache_key, embedding = self._check_cache(description)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append((i, description, cache_key, embedding))
 
-Now formulate this problem:
+        if not pending:
+            logger.info("All problems served from cache, skipping batch call")
+            return results
 
-{problem_description}"""
-        
-        return prompt
-    
-    def _format_result(self, result: Dict) -> Dict:
-        """Format the Gemini result for our application"""
+        logger.info("Submitting batch of %d formulation requests", len(pending))
         try:
-            # Build objective string
-            obj_type = result.get("objective_type", "maximize").capitalize()
-            objective = f"{obj_type} Z = {result['objective_function']}"
-            
-            # Join constraints
-            constraints = "\n".join(result.get("constraints", []))
-            
-            return {
-                "success": True,
-                "objective": objective,
-                "constraints": constraints,
-                "variables": result.get("variables", []),
-                "variable_descriptions": result.get("variable_descriptions", {}),
-                "constraint_descriptions": result.get("constraint_descriptions", {}),
-                "explanation": result.get("explanation", ""),
-                "raw_result": result
-            }
+            requests = []
+            for _, description, _, _ in pending:
+                contents, config = self._prepare_request(description)
+                requests.append({"contents": contents, "config": config})
+
+            job = self.client.batches.create(model=self.model, src=requests)
+            job = self._wait_for_batch(job)
+
+            responses = job.dest.inlined_responses
+            for (i, _, cache_key, embedding), inlined in zip(pending, responses):
+                if inlined.response is not None:
+                    results[i] = self._handle_response(
+                        inlined.response, cache_key, embedding
+                    )
+                else:
+                    results[i] = {
+                        "error": f"Batch request failed: {inlined.error}",
+                        "success": False,
+                    }
         except Exception as e:
-            return {
+            # Batch endpoint unavailable - fall back to one call per problem
+            logger.warning(f"Batch API failed ({e}), formulating sequentially")
+            for i, description, _, _ in pending:
+                results[i] = self.formulate_problem(description)
+
+        return results
+
+    def _wait_for_batch(self, job):
+        """Poll a batch job until it reaches a terminal state"""
+        terminal_states = {
+            "JOB_STATE_SUCCEEDED",
+            "JOB_STATE_FAILED",
+            "JOB_STATE_CANCELLED",
+        }
+
+        def state_name(current):
+            # JobState is an Enum whose str() includes the class name
+            # ("JobState.JOB_STATE_SUCCEEDED"), so compare the bare member
+            # name; older SDKs hand back plain strings
+            return getattr(current.state, "name", current.state)
+
+        while state_name(job) not in terminal_states:
+            time.sleep(_BATCH_POLL_SECONDS)
+            job = self.client.batches.get(name=job.name)
+            logger.debug("Batch job state: %s", job.state)
+
+        if state_name(job) != "JOB_STATE_SUCCEEDED":
+            raise RuntimeError(f"Batch job ended in state {job.state}")
+        return job
+
+    def _check_cache(self, problem_description: str):
+        """Look up a cached formulation; returns (result, cache_key, embedding)"""
+        if self.cache is None:
+            return None, None, None
+
+        normalized = normalize_description(problem_description)
+        cache_key = make_cache_key(self.model, GEMINI_TEMPERATURE, normalized)
+        cached = self.cache.get_exact(cache_key)
+        if cached is not None:
+            return cached, cache_key, None
+
+        # Exact miss - try a semantic match via embeddings
+        embedding = self._embed_description(normalized)
+        if embedding is not None:
+            cached = self.cache.get_semantic(embedding)
+            if cached is not None:
+                return cached, cache_key, embedding
+
+        return None, cache_key, embedding
+
+    def _get_context_cache(self) -> Optional[str]:
+        """Create (once) and return the server-side cache for the static prefix"""
+        if self._context_cache_failed:
+            return None
+
+        if self._context_cache_name is None:
+            try:
+                cache = self.client.caches.create(
+                    model=self.model,
+                    config={
+                        "contents": [_STATIC_PREFIX],
+                        "ttl": _CONTEXT_CACHE_TTL,
+                    },
+                )
+                self._context_cache_name = cache.name
+                logger.info(f"Created Gemini context cache: {cache.name}")
+            except Exception as e:
+                # Caches API unavailable (old SDK, unsupported model, quota) -
+                # fall back to sending the prefix inline on every call
+                logger.warning(f"Context caching unavailable, using inline prefix: {e}")
+                self._context_cache_failed = True
+                return None
+
+        return self._context_cache_name
+
+    def _prepare_request(self, problem_description: str):
+        """Assemble request contents and config, using context caching if available"""
+        # Shallow copy of the frozen base config; only per-call keys are added
+        config = dict(_get_base_config())
+
+        # Cap output tokens to the expected formulation size instead of the
+        # global maximum - smaller ceilings improve time-to-first-token
+        config["max_output_tokens"] = _estimate_max_tokens(problem_description)
+
+        cache_name = self._get_context_cache()
+        if cache_name:
+            # Prefix tokens are served from the server-side cache
+            config["cached_content"] = cache_name
+            contents = problem_description
+        else:
+            contents = _build_prompt(problem_description)
+
+        logger.debug("Request contents length: %d chars", len(contents))
+        return contents, config
+
+    def _handle_response(self, response, cache_key=None, embedding=None) -> Dict:
+        """Parse a buffered Gemini response, format it, and cache results"""
+        # Structured output gives us a validated LPFormulation directly
+        parsed = response.parsed
+        if parsed is not None:
+            logger.info("Received validated structured response")
+            return self._finalize_result(parsed.model_dump(), cache_key, embedding)
+
+        # Rare: schema enforcement failed; the raw text is still
+        # guaranteed to be bare JSON (no markdown fences)
+        logger.debug("No parsed payload, falling back to raw JSON text")
+        return self._handle_json_text(response.text, cache_key, embedding)
+
+    def _handle_json_text(self, json_text: str, cache_key=None, embedding=None) -> Dict:
+        """Parse accumulated JSON text, format it, and cache results"""
+        try:
+            result_dict = _loads(json_text)
+        except ValueError:
+            # Response was not bare JSON - rescue the object with a single
+            # precompiled-regex pass rather than repeated find/rfind scans
+            match = _JSON_RE.search(json_text)
+            try:
+                if not match:
+                    raise ValueError("no JSON object found in response")
+                result_dict = _loads(match.group(1) or match.group(2))
+            except ValueError as e:
+                # Covers both json.JSONDecodeError and orjson.JSONDecodeError
+                logger.error(f"JSON parsing error: {e}")
+                return {
+                    "error": f"Failed to parse AI response as JSON: {str(e)}",
+                    "success": False
+                }
+
+        return self._finalize_result(result_dict, cache_key, embedding)
+
+    def _finalize_result(self, result_dict: Dict, cache_key=None, embedding=None) -> Dict:
+        """Format a parsed result and store successful ones in both cache tiers"""
+        formatted_result = self._format_result(result_dict)
+        logger.info("Formulation successful: %s", formatted_result.get("success", False))
+
+        if self.cache is not None and formatted_result.get("success"):
+            self.cache.put(cache_key, formatted_result, embedding)
+
+        return formatted_result
+
+
+    def _embed_description(self, normalized_description: str) -> Optional[List[float]]:
+        """Embed a normalized problem description for semantic cache lookups"""
+        try:
+            response = self.client.models.embed_content(
+                model=GEMINI_EMBEDDING_MODEL,
+                contents=normalized_description,
+            )
+            return list(response.embeddings[0].values)
+        except Exception as e:
+            logger.warning(f"Embedding call failed, skipping semantic cache: {e}")
+            return None
+
+    def _format_result(self, result: Dict) -> Dict:
+        """Format the Gemini result for our application"""
+        # Explicit validation instead of try/except - the only thing that
+        # could raise here was a missing objective_function key
+        obj_fn = result.get("objective_function")
+        if obj_fn is None:
+            return MappingProxyType({
                 "success": False,
-                "error": f"Failed to format result: {str(e)}",
-                "raw_result": result
-            }
\ No newline at end of file
+                "error": "Failed to format result: missing objective_function",
+                "raw_result": MappingProxyType(result)
+            })
+
+        # Build objective string
+        obj_type = result.get("objective_type", "maximize").capitalize()
+        objective = f"{obj_type} Z = {obj_fn}"
+
+        # Read-only mapping: cached results are shared across threads and
+        # coroutines by reference, so callers must copy before mutating
+        return MappingProxyType({
+            "success": True,
+            "objective": objective,
+            "constraints": "\n".join(result.get("constraints") or ()),
+            "variables": result.get("variables", []),
+            "variable_descriptions": result.get("variable_descriptions", {}),
+            "constraint_descriptions": result.get("constraint_descriptions", {}),
+            "explanation": result.get("explanation", ""),
+            "raw_result": MappingProxyType(result)
+        })
\ No newline at end of file
@@ -1,5 +1,8 @@
 """Prompt templates for LP problem formulation"""
 
+import sys
+from types import MappingProxyType
+
 SYSTEM_PROMPT = """You are an expert in formulating Linear Programming (LP) problems. 
 Given a natural language description of an optimization problem, you must:
 
@@ -40,7 +43,7 @@ Important rules:
 - Be precise with coefficients and operators
 """
 
-EXAMPLE_PROBLEMS = [
+_RAW_EXAMPLE_PROBLEMS = [
     {
         "description": """A company makes two products (X and Y) using two machines (A and B). 
 Each unit of X requires 50 minutes on machine A and 30 minutes on machine B.
@@ -113,3 +116,18 @@ Daily requirements:
         },
     },
 ]
+
+# Frozen view of the examples: the values never change, so the container is
+# a tuple of read-only mappings and the descriptions are interned. Mutating
+# an example is a bug; copy first if a modified variant is ever needed.
+# The nested formulation dicts stay plain so they remain JSON-serializable
+# for prompt-prefix construction.
+EXAMPLE_PROBLEMS = tuple(
+    MappingProxyType(
+        {
+            "description": sys.intern(problem["description"]),
+            "formulation": problem["formulation"],
+        }
+    )
+    for problem in _RAW_EXAMPLE_PROBLEMS
+)
@@ -1,8 +1,27 @@
 """Main application module for LP optimizer"""
 
+import copy
+import functools
+import logging
+import uuid
 import re
 import os
-from dash import Dash, callback, Output, Input, State, no_update, dcc, ctx
+import threading
+from collections import OrderedDict
+
+import diskcache
+import orjson
+from dash import (
+    ClientsideFunction,
+    Dash,
+    DiskcacheManager,
+    callback,
+    Output,
+    Input,
+    State,
+    no_update,
+    dcc,
+)
 import dash_mantine_components as dmc
 from dash_iconify import DashIconify
 from .utils.logger import get_logger, LPLogger
@@ -15,22 +34,212 @@ from .components import (
     create_solver_log_panel,
     create_formulation_results,
 )
-from .solvers import PuLPSolver
+from .solvers import PuLPSolver, RaceSolver
 from .solvers.highs_solver import HiGHSSolver
-from .visualization import LPPlotter
 from .ai import LPFormulator
-from .examples import EXAMPLE_PROBLEMS_LIBRARY
+from .examples import EXAMPLE_PROBLEMS_LIBRARY, EXAMPLE_DESCRIPTIONS
 
 # Get logger for app module
 logger = get_logger("app")
 
+# Strips an optional "Max(imize)/Min(imize) Z =" prefix from the objective;
+# compiled once instead of per solve click
+_OBJ_PREFIX_RE = re.compile(
+    r"^(max(imize)?|min(imize)?)\s*Z\s*=\s*", re.IGNORECASE
+)
+
+
+def _to_json_ready(data):
+    """Convert a dict with numpy values to plain JSON-ready Python types"""
+    # One C-level walk: orjson serializes numpy scalars/arrays natively,
+    # replacing the old recursive Python-level type-checking pass
+    return orjson.loads(orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY))
+
+
+# Lazily-created solver instances, reused across callbacks so each click
+# does not pay the constructor cost again
+_SOLVER_CLASSES = {"highs": HiGHSSolver, "pulp": PuLPSolver, "race": RaceSolver}
+_SOLVERS = {}
+_SOLVER_LOCK = threading.Lock()
+
+
+def _get_solver(solver_type: str):
+    """Get or create the shared solver instance for a solver type"""
+    solver = _SOLVERS.get(solver_type)
+    if solver is None:
+        with _SOLVER_LOCK:
+            # Double-checked: another thread may have built it meanwhile
+            solver = _SOLVERS.get(solver_type)
+            if solver is None:
+                solver = _SOLVER_CLASSES.get(solver_type, PuLPSolver)()
+                _SOLVERS[solver_type] = solver
+    return solver
+
+
+# Solver logs are kept server-side and fetched only when the Solver Log
+# accordion is opened, so the (potentially large) text never rides along in
+# the solution store's JSON payload. The store holds as many logs as
+# _cached_solve holds solutions - every cached solution embeds a log_id, so
+# a smaller log store would serve cache hits whose log was already evicted
+_SOLVE_CACHE_SIZE = 128
+_LOG_STORE = OrderedDict()
+_LOG_STORE_MAX = _SOLVE_CACHE_SIZE
+_LOG_STORE_LOCK = threading.Lock()
+
+
+def _put_log(log_text: str) -> str:
+    """Store a solver log server-side and return its lookup id"""
+    log_id = uuid.uuid4().hex
+    with _LOG_STORE_LOCK:
+        _LOG_STORE[log_id] = log_text
+        while len(_LOG_STORE) > _LOG_STORE_MAX:
+            # Evict oldest entries first
+            _LOG_STORE.popitem(last=False)
+    return log_id
+
+
+def _get_log(log_id: str) -> str:
+    """Fetch a stored solver log, refreshing its LRU position"""
+    with _LOG_STORE_LOCK:
+        log_text = _LOG_STORE.get(log_id)
+        if log_text is not None:
+            _LOG_STORE.move_to_end(log_id)
+    return log_text
+
+
+# Renders the optimal-point figure in the browser - the figure is pure JSON
+# assembly, so a server round trip per solve would be wasted work
+_PLOT_CLIENTSIDE_JS = """
+function(data) {
+    var empty = function(msg) {
+        return {
+            data: [],
+            layout: {
+                xaxis: {visible: false},
+                yaxis: {visible: false},
+                height: 400,
+                annotations: [{
+                    text: msg, xref: "paper", yref: "paper",
+                    x: 0.5, y: 0.5, showarrow: false, font: {size: 14}
+                }]
+            }
+        };
+    };
+    if (!data || data.success === false) {
+        return empty("Solve a problem to see the visualization");
+    }
+    var keys = Object.keys(data.variables || {});
+    if (keys.length !== 2) {
+        return empty("Visualization is only available for problems with 2 variables");
+    }
+    var x = data.variables[keys[0]];
+    var y = data.variables[keys[1]];
+    return {
+        data: [{
+            x: [x], y: [y], mode: "markers",
+            marker: {size: 12, color: "red"},
+            name: "Optimal Solution (" + x.toFixed(2) + ", " + y.toFixed(2) + ")"
+        }],
+        layout: {
+            title: "Optimal Solution: " + data.objective_value.toFixed(2),
+            xaxis: {title: keys[0]},
+            yaxis: {title: keys[1]},
+            showlegend: true,
+            height: 400
+        }
+    };
+}
+"""
+
+
+# Credential check done once at import - the keys don't change at runtime,
+# and the missing-key alert is static so it is built once too
+_HAS_AI_CREDS = bool(os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY"))
+_NO_CREDS_ALERT = dmc.Alert(
+    "Please set GEMINI_API_KEY or GOOGLE_API_KEY environment variable to use AI features",
+    title="Configuration Error",
+    color="red",
+)
+_UNKNOWN_ERROR_ALERT = dmc.Alert(
+    "Unknown error occurred",
+    title="Formulation Error",
+    color="red",
+)
+
+
+# Shared formulator instance - keeps the Gemini client (and its pooled HTTP
+# connections) alive across formulation requests
+_FORMULATOR = None
+_FORMULATOR_LOCK = threading.Lock()
+
+
+def _get_formulator():
+    """Get or create the shared LPFormulator instance"""
+    global _FORMULATOR
+    if _FORMULATOR is None:
+        with _FORMULATOR_LOCK:
+            # Double-checked: another thread may have built it meanwhile
+            if _FORMULATOR is None:
+                _FORMULATOR = LPFormulator()
+    return _FORMULATOR
+
+
+def _normalize_constraints(constraints: str) -> str:
+    """Normalize constraint text so whitespace variations share a cache entry"""
+    return "\n".join(line.strip() for line in constraints.splitlines() if line.strip())
+
+
+@functools.lru_cache(maxsize=_SOLVE_CACHE_SIZE)
+def _cached_solve(clean_objective, constraints, is_maximize, solver_type):
+    """
+    Solve an LP problem, memoized on the normalized inputs
+
+    Returns a tuple of (solution_data, objective_error, constraint_error)
+    where solution_data is already JSON-ready for the solution store.
+    Cached values are shared across hits - callers must copy before mutating.
+    """
+    solver = _get_solver(solver_type)
+    solution = solver.solve(clean_objective, constraints, is_maximize)
+
+    if solution["success"]:
+        # Prepare solution data for the store (excluding non-serializable
+        # objects); numpy types are converted in one orjson pass
+        solution_data = _to_json_ready({
+            "success": True,
+            "variables": solution["variables"],
+            "objective_value": solution["objective_value"],
+            "status": solution["status"],
+            "log_id": _put_log(solution["log"]),
+            # Don't store the problem object as it's not JSON serializable
+        })
+        return solution_data, None, None
+
+    # Store error information in solution data
+    error_data = {
+        "success": False,
+        "error": solution["error"],
+        "log_id": _put_log(solution.get("log", "")),
+    }
+    return error_data, solution.get("objective_error"), solution.get("constraint_error")
+
 
 def create_app():
     """Create and configure the Dash application"""
     logger.info("Creating Dash application")
     logger.debug("Initializing with Mantine components")
     
-    app = Dash(__name__, external_stylesheets=[dmc.styles.ALL], suppress_callback_exceptions=True)
+    # Background-callback manager: long-running callbacks (the Gemini HTTP
+    # call) run in a separate process so server workers stay free for solve
+    # requests. Built here rather than at import so merely importing this
+    # module never touches the cache directory or diskcache's process deps.
+    background_manager = DiskcacheManager(diskcache.Cache("./.cache"))
+
+    app = Dash(
+        __name__,
+        external_stylesheets=[dmc.styles.ALL],
+        suppress_callback_exceptions=True,
+        background_callback_manager=background_manager,
+    )
     logger.debug("Dash app instance created with suppress_callback_exceptions=True")
 
     app.layout = dmc.MantineProvider(
@@ -98,6 +307,7 @@ def create_app():
                                 span=12,
                                 children=[
                                     dmc.Accordion(
+                                        id="solver-log-accordion",
                                         children=[
                                             dmc.AccordionItem(
                                                 value="solver-log",
@@ -179,10 +389,11 @@ def register_callbacks(app):
     )
     def solve_problem(n_clicks, objective, constraints, objective_type, solver_type):
         """Solve the LP problem and update the UI"""
-        logger.info(f"🎯 solve_problem callback triggered (n_clicks={n_clicks})")
-        logger.debug(f"  Objective: {objective}")
-        logger.debug(f"  Constraints: {constraints}")
-        logger.debug(f"  Type: {objective_type}, Solver: {solver_type}")
+        logger.info("🎯 solve_problem callback triggered (n_clicks=%s)", n_clicks)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  Objective: %s", objective)
+            logger.debug("  Constraints: %s", constraints)
+            logger.debug("  Type: %s, Solver: %s", objective_type, solver_type)
         
         if not n_clicks or not objective or not constraints:
             logger.debug("Missing required inputs, returning no_update")
@@ -191,80 +402,35 @@ def register_callbacks(app):
         try:
             logger.info("Processing LP problem...")
             # Clean objective function string
-            clean_objective = re.sub(
-                r"^(max(imize)?|min(imize)?)\s*Z\s*=\s*", "", objective, flags=re.IGNORECASE
-            ).strip()
+            clean_objective = _OBJ_PREFIX_RE.sub("", objective).strip()
 
-            # Reconstruct the objective with the correct prefix
-            full_objective = f"{objective_type.capitalize()} Z = {clean_objective}"
-            
             # Select solver based on user choice
             is_maximize = objective_type == "maximize"
-            logger.info(f"Using {solver_type.upper()} solver (maximize={is_maximize})")
-            
-            if solver_type == "highs":
-                solver = HiGHSSolver()
-                solution = solver.solve(clean_objective, constraints, is_maximize)
-            else:
-                solver = PuLPSolver()
-                solution = solver.solve(clean_objective, constraints, is_maximize)
-            
-            logger.debug(f"Solver returned: success={solution.get('success')}")
+            logger.info("Using %s solver (maximize=%s)", solver_type.upper(), is_maximize)
 
-            if solution["success"]:
-                logger.info("✅ Problem solved successfully")
-                logger.debug(f"Optimal value: {solution['objective_value']}")
-                
-                # Convert numpy types to Python native types for JSON serialization
-                import numpy as np
-                
-                def convert_to_native(obj):
-                    """Convert numpy types to native Python types"""
-                    if isinstance(obj, dict):
-                        return {k: convert_to_native(v) for k, v in obj.items()}
-                    elif isinstance(obj, (list, tuple)):
-                        return [convert_to_native(item) for item in obj]
-                    elif isinstance(obj, (np.integer, np.floating)):
-                        return float(obj)
-                    elif isinstance(obj, np.ndarray):
-                        return obj.tolist()
-                    else:
-                        return obj
-                
-                # Prepare solution data for the store (excluding non-serializable objects)
-                solution_data = {
-                    "success": True,
-                    "variables": convert_to_native(solution["variables"]),
-                    "objective_value": float(solution["objective_value"]) if hasattr(solution["objective_value"], 'item') else solution["objective_value"],
-                    "status": solution["status"],
-                    "solution": convert_to_native(solution["variables"]),  # For compatibility
-                    "optimal_value": float(solution["objective_value"]) if hasattr(solution["objective_value"], 'item') else solution["objective_value"],  # For compatibility
-                    # Don't store the problem object as it's not JSON serializable
-                }
+            # Memoized: repeated solves of the same problem skip the solver
+            solution_data, objective_error, constraint_error = _cached_solve(
+                clean_objective,
+                _normalize_constraints(constraints),
+                is_maximize,
+                solver_type,
+            )
+            logger.debug("Solver returned: success=%s", solution_data.get("success"))
 
+            if solution_data["success"]:
+                logger.info("✅ Problem solved successfully")
+                logger.debug("Optimal value: %s", solution_data["objective_value"])
                 logger.info("Returning successful solution to UI")
-                # Store complete solution data including all needed fields
-                solution_data["solver_log"] = solution["log"]
-                return (
-                    solution_data,
-                    False,
-                    None,
-                    None,
-                )
             else:
-                logger.warning(f"Solver failed: {solution.get('error')}")
-                # Store error information in solution data
-                error_data = {
-                    "success": False,
-                    "error": solution["error"],
-                    "solver_log": solution.get("log", "")
-                }
-                return (
-                    error_data,
-                    False,
-                    solution.get("objective_error"),
-                    solution.get("constraint_error"),
-                )
+                logger.warning("Solver failed: %s", solution_data.get("error"))
+
+            # Shallow copy so callers never mutate the shared cached dict
+            return (
+                copy.copy(solution_data),
+                False,
+                objective_error,
+                constraint_error,
+            )
         except Exception as e:
             logger.error(f"Exception in solve_problem: {e}", exc_info=True)
             error_data = {
@@ -278,113 +444,63 @@ def register_callbacks(app):
                 "Check format",
             )
 
-    # Callback 2: Update results display
+    # Callback 2: Results rendered clientside from the store data
+    # (assets/solution_renderer.js; create_solution_display remains the
+    # server-side fallback for non-callback rendering)
     callback_count += 1
     LPLogger.log_callback_registration(
         logger,
-        "update_results",
+        "update_results (clientside)",
         inputs=["solution-store.data"],
         outputs=["results-container.children"]
     )
-    @callback(Output("results-container", "children"), Input("solution-store", "data"))
-    def update_results(solution_data):
-        """Update results display based on solution data"""
-        logger.debug(f"update_results callback triggered with data: {solution_data is not None}")
-        
-        if not solution_data:
-            return no_update
-            
-        if solution_data.get("success") == False:
-            # Display error alert
-            return dmc.Alert(
-                solution_data.get("error", "Unknown error"),
-                title="Solver Error",
-                color="red",
-                withCloseButton=True
-            )
-        
-        # Display successful solution
-        return create_solution_display(solution_data)
+    app.clientside_callback(
+        ClientsideFunction(namespace="ui", function_name="render_solution"),
+        Output("results-container", "children"),
+        Input("solution-store", "data"),
+        prevent_initial_call=True,
+    )
 
-    # Callback 3: Update plot
+    # Callback 3: Plot rendered clientside - no Python round trip
     callback_count += 1
     LPLogger.log_callback_registration(
         logger,
-        "update_plot",
+        "update_plot (clientside)",
         inputs=["solution-store.data"],
         outputs=["feasible-region-plot.figure"]
     )
-    @callback(Output("feasible-region-plot", "figure"), Input("solution-store", "data"))
-    def update_plot(solution_data):
-        """Update visualization based on solution data"""
-        logger.debug(f"update_plot callback triggered with data: {solution_data is not None}")
-        if not solution_data or solution_data.get("success") == False:
-            return LPPlotter._create_empty_plot(
-                "Solve a problem to see the visualization"
-            )
-
-        # Check if we can visualize (2 variables or less)
-        if solution_data.get("variables") and len(solution_data.get("variables", {})) <= 2:
-            # For now, just create a simple plot since we can't store the problem object
-            import plotly.graph_objects as go
-            fig = go.Figure()
-            
-            # Add the optimal point
-            var_names = list(solution_data["variables"].keys())
-            if len(var_names) == 2:
-                x_val = solution_data["variables"][var_names[0]]
-                y_val = solution_data["variables"][var_names[1]]
-                
-                fig.add_trace(go.Scatter(
-                    x=[x_val],
-                    y=[y_val],
-                    mode='markers',
-                    marker=dict(size=12, color='red'),
-                    name=f'Optimal Solution ({x_val:.2f}, {y_val:.2f})'
-                ))
-                
-                fig.update_layout(
-                    title=f"Optimal Solution: {solution_data['objective_value']:.2f}",
-                    xaxis_title=var_names[0],
-                    yaxis_title=var_names[1],
-                    showlegend=True,
-                    height=400
-                )
-            
-            return fig
-        else:
-            # Create an empty figure for problems with more than 2 variables
-            import plotly.graph_objects as go
-            fig = go.Figure()
-            fig.add_annotation(
-                text="Visualization is only available for problems with 2 variables",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False,
-                font=dict(size=14)
-            )
-            fig.update_layout(
-                xaxis=dict(visible=False),
-                yaxis=dict(visible=False),
-                height=400
-            )
-            return fig
+    app.clientside_callback(
+        _PLOT_CLIENTSIDE_JS,
+        Output("feasible-region-plot", "figure"),
+        Input("solution-store", "data"),
+    )
 
-    # Callback 4: Update solver log
+    # Callback 4: Solver log loaded on demand when the accordion opens,
+    # and refreshed on new solves while it stays open
     callback_count += 1
     LPLogger.log_callback_registration(
         logger,
         "update_solver_log",
-        inputs=["solution-store.data"],
+        inputs=["solver-log-accordion.value", "solution-store.data"],
         outputs=["solver-log-content.children"]
     )
-    @callback(Output("solver-log-content", "children"), Input("solution-store", "data"))
-    def update_solver_log(solution_data):
-        """Update solver log display"""
-        logger.debug(f"update_solver_log callback triggered with data: {solution_data is not None}")
-        if not solution_data:
-            return "No solver output yet"
+    @callback(
+        Output("solver-log-content", "children"),
+        Input("solver-log-accordion", "value"),
+        Input("solution-store", "data"),
+        prevent_initial_call=True,
+    )
+    def update_solver_log(accordion_value, solution_data):
+        """Load the solver log when the accordion is open
 
-        return solution_data.get("solver_log", "No solver log available")
+        Fires on both accordion toggles and new solutions; while the
+        accordion is closed, new solves are skipped and the log is
+        fetched when it next opens.
+        """
+        if accordion_value != "solver-log" or not solution_data:
+            return no_update
+        log_text = _get_log(solution_data.get("log_id", ""))
+        return log_text if log_text else "No solver log available"
 
     # AI-related callbacks
     # Callback 5: Load example problem
@@ -396,15 +512,14 @@ def register_callbacks(app):
         outputs=["nl-problem-input.value"]
     )
     @callback(
-        Output("nl-problem-input", "value"), Input("example-problem-select", "value")
+        Output("nl-problem-input", "value"),
+        Input("example-problem-select", "value"),
+        prevent_initial_call=True,
     )
     def load_example_problem(example_key):
         """Load example problem description"""
-        logger.debug(f"load_example_problem triggered with key: {example_key}")
-        if example_key and example_key in EXAMPLE_PROBLEMS_LIBRARY:
-            logger.info(f"Loading example problem: {example_key}")
-            return EXAMPLE_PROBLEMS_LIBRARY[example_key]["description"]
-        return no_update
+        logger.debug("load_example_problem triggered with key: %s", example_key)
+        return EXAMPLE_DESCRIPTIONS.get(example_key, no_update)
 
     # Callback 6: AI formulation
     callback_count += 1
@@ -415,7 +530,6 @@ def register_callbacks(app):
         outputs=[
             "formulation-results.children",
             "ai-formulation-store.data",
-            "formulate-button.loading"
         ],
         states=["nl-problem-input.value"]
     )
@@ -423,51 +537,51 @@ def register_callbacks(app):
         [
             Output("formulation-results", "children"),
             Output("ai-formulation-store", "data"),
-            Output("formulate-button", "loading"),
         ],
         Input("formulate-button", "n_clicks"),
         State("nl-problem-input", "value"),
+        background=True,
+        running=[(Output("formulate-button", "loading"), True, False)],
         prevent_initial_call=True,
     )
     def formulate_with_ai(n_clicks, problem_description):
         """Handle AI formulation button click"""
-        logger.info(f"🤖 formulate_with_ai triggered (n_clicks={n_clicks})")
+        logger.info("🤖 formulate_with_ai triggered (n_clicks=%s)", n_clicks)
         if not n_clicks or not problem_description:
             logger.debug("Missing inputs for AI formulation")
-            return [], None, False
+            return [], None
 
         try:
             logger.info("Starting AI formulation process")
             # Check if API credentials are available
-            if not (os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")):
-                error_alert = dmc.Alert(
-                    "Please set GEMINI_API_KEY or GOOGLE_API_KEY environment variable to use AI features",
-                    title="Configuration Error",
-                    color="red",
-                )
-                return [error_alert], None, False
-
-            # Initialize formulator
-            logger.debug("Initializing LPFormulator")
-            formulator = LPFormulator()
+            if not _HAS_AI_CREDS:
+                return [_NO_CREDS_ALERT], None
 
-            # Get formulation
+            # Get formulation - repeated prompts are served from the
+            # formulator's disk-backed LPCache, which survives the
+            # per-invocation worker processes background callbacks run in
+            # (an in-process lru_cache would die with each worker)
             logger.info("Calling AI formulator...")
-            result = formulator.formulate_problem(problem_description)
-            logger.debug(f"Formulation result: success={result.get('success')}")
+            result = _get_formulator().formulate_problem(problem_description)
+            logger.debug("Formulation result: success=%s", result.get("success"))
 
             if result.get("success"):
                 # Create results display
                 results_display = create_formulation_results(result)
-                return results_display, result, False
+                # The formulator returns a read-only mapping; the store needs
+                # plain JSON-serializable dicts, so unwrap before storing
+                store_data = dict(result)
+                store_data["raw_result"] = dict(result["raw_result"])
+                return results_display, store_data
             else:
-                # Show error
-                error_alert = dmc.Alert(
-                    result.get("error", "Unknown error occurred"),
-                    title="Formulation Error",
-                    color="red",
+                # Show error (the no-message case reuses the prebuilt alert)
+                error = result.get("error")
+                error_alert = (
+                    dmc.Alert(error, title="Formulation Error", color="red")
+                    if error
+                    else _UNKNOWN_ERROR_ALERT
                 )
-                return [error_alert], None, False
+                return [error_alert], None
 
         except Exception as e:
             logger.error(f"Exception in formulate_with_ai: {e}", exc_info=True)
@@ -476,7 +590,7 @@ def register_callbacks(app):
                 title="Unexpected Error",
                 color="red",
             )
-            return [error_alert], None, False
+            return [error_alert], None
 
     # Callback 7: Copy to manual input
     callback_count += 1
@@ -503,7 +617,7 @@ def register_callbacks(app):
     )
     def copy_to_manual_input(n_clicks, formulation_data):
         """Copy AI formulation to manual input fields"""
-        logger.info(f"copy_to_manual_input triggered (n_clicks={n_clicks})")
+        logger.info("copy_to_manual_input triggered (n_clicks=%s)", n_clicks)
         if not n_clicks or not formulation_data:
             logger.debug("No data to copy")
             return no_update, no_update, no_update
@@ -512,8 +626,9 @@ def register_callbacks(app):
             objective = formulation_data.get("objective", "")
             constraints = formulation_data.get("constraints", "")
             logger.info("Copying AI formulation to manual input fields")
-            logger.debug(f"Objective: {objective}")
-            logger.debug(f"Constraints: {constraints}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Objective: %s", objective)
+                logger.debug("Constraints: %s", constraints)
 
             # Switch to manual tab and populate fields
             return objective, constraints, "manual"
@@ -521,4 +636,4 @@ def register_callbacks(app):
         logger.warning("Formulation data not successful")
         return no_update, no_update, no_update
     
-    logger.info(f"✅ Total callbacks registered: {callback_count + 1}")
+    logger.info("✅ Total callbacks registered: %s", callback_count + 1)
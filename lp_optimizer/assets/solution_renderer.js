@@ -0,0 +1,68 @@
+/* Clientside solution renderer.
+ *
+ * Mirrors components/results_panel.py:create_solution_display but runs in
+ * the browser, so rendering a solution costs no server round trip. The
+ * solution data is already on the client in solution-store; this just maps
+ * it to Mantine component objects.
+ */
+
+window.dash_clientside = window.dash_clientside || {};
+
+window.dash_clientside.ui = {
+  render_solution: function (data) {
+    var dmc = function (type, props) {
+      return {namespace: "dash_mantine_components", type: type, props: props};
+    };
+
+    if (!data) {
+      return window.dash_clientside.no_update;
+    }
+
+    if (data.success === false || data.error) {
+      return dmc("Alert", {
+        title: "Solver Error",
+        color: "red",
+        withCloseButton: true,
+        children: data.error || "Unknown error",
+      });
+    }
+
+    var status = data.status || "unknown";
+    if (status !== "optimal") {
+      var statusMessages = {
+        infeasible: "The problem is infeasible - no solution exists that satisfies all constraints.",
+        unbounded: "The problem is unbounded - the objective can be improved infinitely.",
+        not_solved: "The problem could not be solved.",
+        undefined: "The problem status is undefined.",
+      };
+      return dmc("Alert", {
+        title: "Status: " + status.replace(/_/g, " "),
+        color: "yellow",
+        children: statusMessages[status] || "Unknown status",
+      });
+    }
+
+    var variables = data.variables || {};
+    var body = Object.keys(variables).map(function (name) {
+      return [name, variables[name].toFixed(4)];
+    });
+
+    return dmc("Stack", {
+      children: [
+        dmc("Alert", {
+          title: "Optimal Solution Found!",
+          color: "green",
+          children: "Optimal objective value: " + data.objective_value.toFixed(4),
+        }),
+        dmc("Title", {order: 4, children: "Variable Values"}),
+        dmc("Table", {
+          striped: true,
+          highlightOnHover: true,
+          withTableBorder: true,
+          withColumnBorders: true,
+          data: {head: ["Variable", "Value"], body: body},
+        }),
+      ],
+    });
+  },
+};
@@ -1,9 +1,11 @@
 """Input panel component for LP problems"""
 
+import functools
+
 import dash_mantine_components as dmc
 from dash_iconify import DashIconify
 
-from ..config import DEFAULT_OBJECTIVE, DEFAULT_CONSTRAINTS
+from ..config import DEFAULT_OBJECTIVE, DEFAULT_CONSTRAINTS, DEFAULT_SOLVER
 from .nl_input_panel import create_nl_input_panel
 from ..utils.logger import get_logger, LPLogger
 
@@ -11,8 +13,13 @@ from ..utils.logger import get_logger, LPLogger
 logger = get_logger("ui.input_panel")
 
 
+@functools.lru_cache(maxsize=1)
 def create_manual_input_tab():
-    """Create the manual input form"""
+    """Create the manual input form
+
+    The layout is static (it only depends on config constants), so the
+    component tree is built once and reused on later calls.
+    """
     logger.info("Creating manual input tab")
     
     # Create objective type select
@@ -33,10 +40,11 @@ def create_manual_input_tab():
     solver_select = dmc.Select(
         id="solver-select",
         label="Solver",
-        value="highs",
+        value=DEFAULT_SOLVER,
         data=[
             {"label": "HiGHS (SciPy)", "value": "highs"},
             {"label": "PuLP (CBC)", "value": "pulp"},
+            {"label": "Race (first finisher)", "value": "race"},
         ],
         mb="md",
     )
@@ -76,7 +84,7 @@ def create_manual_input_tab():
         variant="gradient",
         gradient={"from": "indigo", "to": "cyan"},
     )
-    logger.debug(f"Solve button properties: fullWidth=True, size=lg, variant=gradient")
+    logger.debug("Solve button properties: fullWidth=True, size=lg, variant=gradient")
     
     return dmc.Stack(
         [
@@ -89,11 +97,10 @@ def create_manual_input_tab():
     )
 
 
+@functools.lru_cache(maxsize=1)
 def create_input_panel():
     """Create the problem input panel with tabs"""
-    logger.info("="*60)
     logger.info("Creating main input panel with tabs")
-    logger.info("="*60)
     
     LPLogger.log_component_creation(logger, "input-mode-tabs", "input-mode-tabs")
     
@@ -1,21 +1,30 @@
 """Natural language input panel component"""
 
+import functools
+
 import dash_mantine_components as dmc
 from dash_iconify import DashIconify
 
 from ..config import DEFAULT_PROBLEM_DESCRIPTION
-from ..utils.logger import get_logger, LPLogger
+from ..examples import SELECT_OPTIONS
+from ..utils.logger import get_logger
 
 # Get logger for this module
 logger = get_logger("ui.nl_input_panel")
 
 
+@functools.lru_cache(maxsize=1)
 def create_nl_input_panel():
-    """Create the natural language input panel"""
+    """Create the natural language input panel
+
+    The panel is static, so the component tree is built once and reused.
+    """
     logger.info("Creating natural language input panel")
-    
+    logger.debug(
+        "Creating components: nl-problem-input, example-problem-select, formulate-button"
+    )
+
     # Create problem input textarea
-    LPLogger.log_component_creation(logger, "nl-problem-input", "nl-problem-input")
     problem_input = dmc.Textarea(
         id="nl-problem-input",
         label="Problem Description",
@@ -28,26 +37,17 @@ def create_nl_input_panel():
     )
     
     # Create example problem selector
-    LPLogger.log_component_creation(logger, "example-problem-select", "example-problem-select")
     example_select = dmc.Select(
         id="example-problem-select",
         label="Load Example Problem",
         placeholder="Choose an example...",
-        data=[
-            {"value": "production", "label": "Production Planning"},
-            {"value": "diet", "label": "Diet Problem"},
-            {"value": "transportation", "label": "Transportation"},
-            {"value": "portfolio", "label": "Portfolio Optimization"},
-            {"value": "custom", "label": "Custom Problem"},
-        ],
+        data=list(SELECT_OPTIONS),
         value="production",
         clearable=False,
         leftSection=DashIconify(icon="tabler:bookmark"),
     )
     
     # Create formulate button
-    LPLogger.log_component_creation(logger, "formulate-button", "formulate-button")
-    logger.info("⚠️ Creating FORMULATE BUTTON with id='formulate-button'")
     formulate_button = dmc.Button(
         "Formulate with AI",
         id="formulate-button",
@@ -58,7 +58,7 @@ def create_nl_input_panel():
         gradient={"from": "violet", "to": "cyan"},
         loading=False,
     )
-    logger.debug(f"Formulate button properties: fullWidth=True, size=lg, variant=gradient")
+    logger.debug("Formulate button properties: fullWidth=True, size=lg, variant=gradient")
     
     return dmc.Stack(
         [
@@ -1,9 +1,12 @@
 """Results panel component for displaying LP solutions"""
 
+import functools
+
 import dash_mantine_components as dmc
 from dash_iconify import DashIconify
 
 
+@functools.lru_cache(maxsize=1)
 def create_results_panel():
     """Create the results display panel"""
     return dmc.Paper(
@@ -47,8 +50,8 @@ def create_solution_display(solution_data):
         )
 
     # Display optimal solution
-    solution = solution_data["solution"]
-    optimal_value = solution_data["optimal_value"]
+    solution = solution_data["variables"]
+    optimal_value = solution_data["objective_value"]
 
     # Create solution table
     table_data = [
@@ -1,9 +1,12 @@
 """Solver log panel component"""
 
+import functools
+
 import dash_mantine_components as dmc
 from dash_iconify import DashIconify
 
 
+@functools.lru_cache(maxsize=1)
 def create_solver_log_panel():
     """Create the solver log accordion panel"""
     return dmc.Accordion(
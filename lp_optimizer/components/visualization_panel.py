@@ -1,9 +1,12 @@
 """Visualization panel component for LP problems"""
 
+import functools
+
 import dash_mantine_components as dmc
 from dash import dcc
 
 
+@functools.lru_cache(maxsize=1)
 def create_visualization_panel():
     """Create the graphical solution panel"""
     return dmc.Paper(
@@ -23,7 +23,7 @@ THEME_COLOR = "light"
 CONTAINER_SIZE = "xl"
 
 # Solver Configuration
-DEFAULT_SOLVER = "pulp"
+DEFAULT_SOLVER = "pulp"  # "pulp", "highs", or "race" (both, first finisher wins)
 SOLVER_TIMEOUT = 60  # seconds
 
 # Visualization Configuration
@@ -41,4 +41,11 @@ GEMINI_MODEL = "gemini-2.5-pro"
 GEMINI_API_KEY = ""  # Set via environment variable
 GEMINI_TEMPERATURE = 0.3  # Lower for more consistent output
 GEMINI_MAX_TOKENS = 8192
-GEMINI_THINKING_BUDGET = -1  # Enable thinking mode
+GEMINI_THINKING_BUDGET = 0  # 0 skips thinking on Flash-class models; Pro
+# models reject 0 and are clamped to their 128-token minimum at request time
+
+# AI Response Cache Configuration
+GEMINI_EMBEDDING_MODEL = "text-embedding-004"
+FORMULATION_CACHE_SIZE = 128  # Max cached formulations per model
+FORMULATION_CACHE_DIR = ".lp_cache"  # Set to None to disable disk persistence
+SEMANTIC_SIMILARITY_THRESHOLD = 0.92  # Cosine similarity for a semantic hit
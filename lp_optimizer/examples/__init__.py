@@ -1,5 +1,11 @@
 """Example LP problems library"""
 
-from .problems import EXAMPLE_PROBLEMS_LIBRARY
+from .problems import EXAMPLE_PROBLEMS_LIBRARY, SELECT_OPTIONS
 
-__all__ = ["EXAMPLE_PROBLEMS_LIBRARY"]
+# Flat {key: description} map precomputed once so callbacks can answer
+# example lookups with a single dict.get
+EXAMPLE_DESCRIPTIONS = {
+    key: problem["description"] for key, problem in EXAMPLE_PROBLEMS_LIBRARY.items()
+}
+
+__all__ = ["EXAMPLE_PROBLEMS_LIBRARY", "EXAMPLE_DESCRIPTIONS", "SELECT_OPTIONS"]
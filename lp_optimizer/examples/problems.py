@@ -1,5 +1,7 @@
 """Library of example LP problems"""
 
+from types import MappingProxyType
+
 EXAMPLE_PROBLEMS_LIBRARY = {
     "production": {
         "title": "Production Planning",
@@ -102,3 +104,11 @@ Be as detailed as possible for better AI formulation.""",
         "constraints": "",
     },
 }
+
+# Freeze the library so shared references cannot be mutated, and build the
+# Select options once at import time instead of per panel creation
+EXAMPLE_PROBLEMS_LIBRARY = MappingProxyType(EXAMPLE_PROBLEMS_LIBRARY)
+SELECT_OPTIONS = tuple(
+    {"value": key, "label": problem["title"]}
+    for key, problem in EXAMPLE_PROBLEMS_LIBRARY.items()
+)
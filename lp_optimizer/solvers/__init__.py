@@ -1,5 +1,6 @@
 """Linear programming solvers"""
 
 from .pulp_solver import PuLPSolver
+from .race_solver import RaceSolver
 
-__all__ = ["PuLPSolver"]
+__all__ = ["PuLPSolver", "RaceSolver"]
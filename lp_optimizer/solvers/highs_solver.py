@@ -1,26 +1,35 @@
 """HiGHS-based solver for linear programming problems using SciPy"""
 
-import numpy as np
-from scipy.optimize import linprog
+import threading
 from typing import Dict, List, Tuple
 
-from ..utils.parser import parse_objective, parse_constraint
+from ..utils.parser import parse_problem
 
+# numpy/scipy are imported lazily on first solve so app startup does not
+# pay their import cost when the user never solves with HiGHS
+np = None
+sp = None
+linprog = None
 
-class MockProblem:
-    """Mock problem object for visualization compatibility"""
-    def __init__(self, variable_names):
-        self._variables = variable_names
-    
-    def variables(self):
-        """Return mock variables for compatibility"""
-        return [type('MockVar', (), {'name': var})() for var in self._variables]
+
+def _import_scipy_stack():
+    """Bind numpy/scipy module globals on first use"""
+    global np, sp, linprog
+    if np is None:
+        import numpy
+        import scipy.sparse
+        from scipy.optimize import linprog as _linprog
+
+        np = numpy
+        sp = scipy.sparse
+        linprog = _linprog
 
 
 class HiGHSSolver:
     """Linear Programming solver using HiGHS via SciPy"""
 
     def __init__(self):
+        self._solve_lock = threading.Lock()
         self.solver_log = ""
         self.variables = []
         self.c = None
@@ -30,7 +39,11 @@ class HiGHSSolver:
         self.b_eq = None
 
     def solve(
-        self, objective_text: str, constraints_text: str, is_maximize: bool
+        self,
+        objective_text: str,
+        constraints_text: str,
+        is_maximize: bool,
+        include_log: bool = True,
     ) -> Dict:
         """
         Solve the LP problem using HiGHS (via SciPy)
@@ -39,116 +52,151 @@ class HiGHSSolver:
             objective_text: String representation of objective function
             constraints_text: String representation of constraints (one per line)
             is_maximize: Whether to maximize (True) or minimize (False)
+            include_log: Build the human-readable solver log. Pass False
+                to skip it (and HiGHS's own display output) when the
+                caller will discard the log.
 
         Returns:
             Dictionary containing solution results
         """
-        try:
-            # Parse objective (now returns constant too)
-            obj_coeffs, variable_names, obj_constant = parse_objective(objective_text)
-            self.variables = sorted(variable_names)  # Ensure consistent ordering
-            
-            # Create coefficient vector (negate if maximizing since scipy minimizes)
-            self.c = np.array([obj_coeffs.get(var, 0) for var in self.variables])
-            if is_maximize:
-                self.c = -self.c
+        # Instance state backs the result construction, so a shared
+        # instance must not run two solves at once (threaded Dash
+        # server); the per-instance lock serializes them
+        with self._solve_lock:
+            try:
+                _import_scipy_stack()
+
+                # Reset per-solve state so a shared instance can be reused safely
+                self.solver_log = ""
+                self.variables = []
+                self.c = None
+                self.A_ub = None
+                self.b_ub = None
+                self.A_eq = None
+                self.b_eq = None
+
+                # Parse the whole problem in one memoized pass
+                obj_coeffs, variable_names, obj_constant, parsed_constraints = (
+                    parse_problem(objective_text, constraints_text)
+                )
+                self.variables = sorted(variable_names)  # Ensure consistent ordering
+                col = {var: i for i, var in enumerate(self.variables)}
+
+                # Create coefficient vector by scattering only the nonzero
+                # objective terms (negate in place if maximizing, since scipy
+                # minimizes)
+                self.c = np.zeros(len(self.variables))
+                for var, coef in obj_coeffs.items():
+                    self.c[col[var]] = coef
+                if is_maximize:
+                    np.negative(self.c, out=self.c)
+
+                # Build the constraint matrix in sparse COO triplets - LP rows
+                # only carry a handful of nonzeros, and HiGHS consumes the
+                # sparse form directly without a dense copy
+                num_constraints = len(parsed_constraints)
+                rows = []
+                cols = []
+                data = []
+                b = np.empty(num_constraints, dtype=np.float64)
+                # +1 for <=, -1 for >= (negated into <= form below), 0 for =
+                signs = np.empty(num_constraints, dtype=np.int8)
+
+                for i, (coeffs, op, rhs) in enumerate(parsed_constraints):
+                    for var, coef in coeffs.items():
+                        if coef:
+                            rows.append(i)
+                            cols.append(col[var])
+                            data.append(coef)
+                    b[i] = rhs
+                    signs[i] = 1 if op == "<=" else (-1 if op == ">=" else 0)
+
+                A = sp.csr_matrix(
+                    (data, (rows, cols)),
+                    shape=(num_constraints, len(self.variables)),
+                    dtype=np.float64,
+                )
+                le_mask = signs == 1
+                ge_mask = signs == -1
+                eq_mask = signs == 0
+
+                self.A_ub = (
+                    sp.vstack([A[le_mask], -A[ge_mask]], format="csr")
+                    if (le_mask.any() or ge_mask.any())
+                    else None
+                )
+                self.b_ub = (
+                    np.concatenate([b[le_mask], -b[ge_mask]])
+                    if self.A_ub is not None
+                    else None
+                )
+                self.A_eq = A[eq_mask] if eq_mask.any() else None
+                self.b_eq = b[eq_mask] if eq_mask.any() else None
             
-            # Initialize constraint matrices
-            A_ub_list = []
-            b_ub_list = []
-            A_eq_list = []
-            b_eq_list = []
+                # Solve using HiGHS
+                res = linprog(
+                    self.c,
+                    A_ub=self.A_ub,
+                    b_ub=self.b_ub,
+                    A_eq=self.A_eq,
+                    b_eq=self.b_eq,
+                    bounds=(0, None),  # All variables non-negative
+                    method="highs",
+                    options={"disp": include_log}
+                )
             
-            # Parse and process constraints
-            constraint_lines = [
-                c.strip() for c in constraints_text.strip().split("\n") if c.strip()
-            ]
-            parsed_constraints = []
+                # Create solver log in one join instead of repeated string
+                # concatenation (also fixes the doubly-escaped newlines that
+                # rendered as literal backslash-n in the UI)
+                if include_log:
+                    log_parts = [
+                        f"HiGHS Solver Status: {res.message}\n",
+                        f"Iterations: {res.nit}\n",
+                        f"Success: {res.success}\n",
+                    ]
+                    if hasattr(res, 'slack'):
+                        log_parts.append(f"\nSlack variables: {res.slack}\n")
+                    self.solver_log = "".join(log_parts)
             
-            for constraint_text in constraint_lines:
-                try:
-                    coeffs, op, rhs = parse_constraint(constraint_text, self.variables)
-                    parsed_constraints.append((coeffs, op, rhs))
-                    
-                    # Create constraint row
-                    row = [coeffs.get(var, 0) for var in self.variables]
-                    
-                    if op == "<=":
-                        A_ub_list.append(row)
-                        b_ub_list.append(rhs)
-                    elif op == ">=":
-                        # Convert >= to <= by negating
-                        A_ub_list.append([-x for x in row])
-                        b_ub_list.append(-rhs)
-                    else:  # op == "="
-                        A_eq_list.append(row)
-                        b_eq_list.append(rhs)
-                        
-                except Exception as e:
+                # Get results
+                if res.success:
+                    solution = {var: res.x[i] for i, var in enumerate(self.variables)}
+                    # Adjust optimal value for maximization and add back the constant term
+                    optimal_value = -res.fun if is_maximize else res.fun
+                    optimal_value += obj_constant  # Add the constant term back
+                
+                    return {
+                        "success": True,
+                        "status": "optimal",
+                        "solution": solution,
+                        "optimal_value": optimal_value,
+                        "objective_value": optimal_value,
+                        "variables": solution,
+                        "variable_names": self.variables,
+                        "objective_coeffs": obj_coeffs,
+                        "objective_constant": obj_constant,
+                        # Struct-of-arrays: parallel columns instead of a list
+                        # of per-constraint tuples
+                        "constraints": {
+                            "coeffs": [c for c, _, _ in parsed_constraints],
+                            "ops": [op for _, op, _ in parsed_constraints],
+                            "rhs": np.asarray([r for _, _, r in parsed_constraints]),
+                        },
+                        "solver_log": self.solver_log,
+                        "log": self.solver_log,
+                        "is_maximize": is_maximize,
+                    }
+                else:
                     return {
                         "success": False,
-                        "error": f"Error parsing constraint '{constraint_text}': {str(e)}"
+                        "status": self._get_status_string(res),
+                        "solver_log": self.solver_log,
+                        "log": self.solver_log,
+                        "error": f"Optimization failed: {self._get_status_string(res)}",
                     }
-            
-            # Convert to numpy arrays if we have constraints
-            self.A_ub = np.array(A_ub_list) if A_ub_list else None
-            self.b_ub = np.array(b_ub_list) if b_ub_list else None
-            self.A_eq = np.array(A_eq_list) if A_eq_list else None
-            self.b_eq = np.array(b_eq_list) if b_eq_list else None
-            
-            # Solve using HiGHS
-            res = linprog(
-                self.c,
-                A_ub=self.A_ub,
-                b_ub=self.b_ub,
-                A_eq=self.A_eq,
-                b_eq=self.b_eq,
-                bounds=(0, None),  # All variables non-negative
-                method="highs",
-                options={"disp": True}
-            )
-            
-            # Create solver log
-            self.solver_log = f"HiGHS Solver Status: {res.message}\\n"
-            self.solver_log += f"Iterations: {res.nit}\\n"
-            self.solver_log += f"Success: {res.success}\\n"
-            if hasattr(res, 'slack'):
-                self.solver_log += f"\\nSlack variables: {res.slack}\\n"
-            
-            # Get results
-            if res.success:
-                solution = {var: res.x[i] for i, var in enumerate(self.variables)}
-                # Adjust optimal value for maximization and add back the constant term
-                optimal_value = -res.fun if is_maximize else res.fun
-                optimal_value += obj_constant  # Add the constant term back
-                
-                return {
-                    "success": True,
-                    "status": "optimal",
-                    "solution": solution,
-                    "optimal_value": optimal_value,
-                    "objective_value": optimal_value,
-                    "variables": solution,
-                    "variable_names": self.variables,
-                    "objective_coeffs": obj_coeffs,
-                    "objective_constant": obj_constant,
-                    "constraints": parsed_constraints,
-                    "solver_log": self.solver_log,
-                    "log": self.solver_log,
-                    "is_maximize": is_maximize,
-                    "problem": MockProblem(self.variables),
-                }
-            else:
-                return {
-                    "success": False,
-                    "status": self._get_status_string(res),
-                    "solver_log": self.solver_log,
-                    "log": self.solver_log,
-                    "error": f"Optimization failed: {self._get_status_string(res)}",
-                }
                 
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+            except Exception as e:
+                return {"success": False, "error": str(e)}
     
     def _get_status_string(self, result) -> str:
         """Convert scipy result status to string"""
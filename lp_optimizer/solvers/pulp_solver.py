@@ -1,23 +1,55 @@
 """PuLP-based solver for linear programming problems"""
 
-import pulp
-import tempfile
 import os
+import threading
 from typing import Dict, List, Tuple
 
-from ..utils.parser import parse_objective, parse_constraint
+from ..utils.parser import parse_problem
+
+# pulp is imported lazily on first solve so app startup does not pay its
+# import cost when the user never solves with CBC
+pulp = None
+
+# Serializes stdout capture: _solve_with_logging redirects the
+# process-global fd 1, so overlapping captures (threaded Dash server,
+# concurrent solves) would cross-wire each other's pipes and deadlock
+# the reader threads
+_STDOUT_CAPTURE_LOCK = threading.Lock()
+
+
+def _import_pulp():
+    """Bind the pulp module global on first use"""
+    global pulp
+    if pulp is None:
+        import pulp as _pulp
+
+        pulp = _pulp
 
 
 class PuLPSolver:
-    """Linear Programming solver using PuLP library"""
+    """Linear Programming solver using PuLP library
+
+    Args:
+        cmd: Optional PuLP solver backend. Defaults to CBC via
+            PULP_CBC_CMD, which writes the model to disk and forks a
+            subprocess; callers that want to skip that overhead can
+            pass an API-backed solver (e.g. pulp.HiGHS) or a quieter
+            CBC configuration here.
+    """
 
-    def __init__(self):
+    def __init__(self, cmd=None):
         self.prob = None
         self.variables = {}
         self.solver_log = ""
+        self._cmd = cmd
+        self._solve_lock = threading.Lock()
 
     def solve(
-        self, objective_text: str, constraints_text: str, is_maximize: bool
+        self,
+        objective_text: str,
+        constraints_text: str,
+        is_maximize: bool,
+        include_log: bool = True,
     ) -> Dict:
         """
         Solve the LP problem using PuLP
@@ -26,44 +58,60 @@ class PuLPSolver:
             objective_text: String representation of objective function
             constraints_text: String representation of constraints (one per line)
             is_maximize: Whether to maximize (True) or minimize (False)
+            include_log: Capture CBC's output into the result's log fields.
+                Pass False to skip the stdout-capture machinery entirely
+                when the caller will discard the log.
 
         Returns:
             Dictionary containing solution results
         """
-        try:
-            # Parse objective (now returns constant too)
-            obj_coeffs, variable_names, obj_constant = parse_objective(objective_text)
-
-            # Create PuLP problem
-            if is_maximize:
-                self.prob = pulp.LpProblem("LP_Problem", pulp.LpMaximize)
-            else:
-                self.prob = pulp.LpProblem("LP_Problem", pulp.LpMinimize)
-
-            # Create variables (non-negative by default)
-            self.variables = {
-                var: pulp.LpVariable(var, lowBound=0) for var in variable_names
-            }
-
-            # Set objective
-            self.prob += pulp.lpSum(
-                [obj_coeffs.get(var, 0) * self.variables[var] for var in variable_names]
-            )
-
-            # Parse and add constraints
-            constraint_lines = [
-                c.strip() for c in constraints_text.strip().split("\n") if c.strip()
-            ]
-            parsed_constraints = []
-
-            for constraint_text in constraint_lines:
-                try:
-                    coeffs, op, rhs = parse_constraint(constraint_text, variable_names)
-                    parsed_constraints.append((coeffs, op, rhs))
-
-                    # Add to PuLP problem
-                    lhs_expr = pulp.lpSum(
-                        [coeffs[var] * self.variables[var] for var in variable_names]
+        # Instance state backs the result construction, so a shared
+        # instance must not run two solves at once (threaded Dash
+        # server); the per-instance lock serializes them
+        with self._solve_lock:
+            try:
+                _import_pulp()
+
+                # Reset per-solve state so a shared instance can be reused safely
+                self.prob = None
+                self.variables = {}
+                self.solver_log = ""
+
+                # Parse the whole problem in one memoized pass
+                obj_coeffs, variable_names, obj_constant, parsed_constraints = (
+                    parse_problem(objective_text, constraints_text)
+                )
+
+                # Create PuLP problem
+                if is_maximize:
+                    self.prob = pulp.LpProblem("LP_Problem", pulp.LpMaximize)
+                else:
+                    self.prob = pulp.LpProblem("LP_Problem", pulp.LpMinimize)
+
+                # Create variables (non-negative by default)
+                self.variables = {
+                    var: pulp.LpVariable(var, lowBound=0) for var in variable_names
+                }
+
+                # Set objective - building the affine expression from the
+                # coefficient pairs directly avoids lpSum's term-by-term
+                # intermediate expressions, and zero coefficients are skipped
+                self.prob += pulp.LpAffineExpression(
+                    [
+                        (self.variables[var], coef)
+                        for var, coef in obj_coeffs.items()
+                        if coef
+                    ]
+                )
+
+                # Add the parsed constraints to the PuLP problem
+                for coeffs, op, rhs in parsed_constraints:
+                    lhs_expr = pulp.LpAffineExpression(
+                        [
+                            (self.variables[var], coef)
+                            for var, coef in coeffs.items()
+                            if coef
+                        ]
                     )
 
                     if op == "<=":
@@ -73,67 +121,100 @@ class PuLPSolver:
                     else:  # op == '='
                         self.prob += lhs_expr == rhs
 
-                except Exception as e:
+                # Solve the problem
+                if include_log:
+                    self._solve_with_logging()
+                else:
+                    # No capture requested - solve directly and keep CBC quiet
+                    # so nothing leaks to the real stdout
+                    self.prob.solve(
+                        self._cmd
+                        if self._cmd is not None
+                        else pulp.PULP_CBC_CMD(msg=False)
+                    )
+
+                # Get results
+                if self.prob.status == pulp.LpStatusOptimal:
+                    solution = {var: self.variables[var].varValue for var in variable_names}
+                    optimal_value = pulp.value(self.prob.objective)
+                    # Add the constant term back to the objective value
+                    optimal_value += obj_constant
+
+                    return {
+                        "success": True,
+                        "status": "optimal",
+                        "solution": solution,
+                        "optimal_value": optimal_value,
+                        "objective_value": optimal_value,
+                        "variables": solution,
+                        "variable_names": variable_names,
+                        "objective_coeffs": obj_coeffs,
+                        "objective_constant": obj_constant,
+                        # Struct-of-arrays: parallel columns instead of a list
+                        # of per-constraint tuples (plain lists - this module
+                        # has no numpy dependency)
+                        "constraints": {
+                            "coeffs": [c for c, _, _ in parsed_constraints],
+                            "ops": [op for _, op, _ in parsed_constraints],
+                            "rhs": [r for _, _, r in parsed_constraints],
+                        },
+                        "solver_log": self.solver_log,
+                        "log": self.solver_log,
+                        "is_maximize": is_maximize,
+                        "problem": self.prob,
+                    }
+                else:
                     return {
                         "success": False,
-                        "error": f"Error parsing constraint '{constraint_text}': {str(e)}"
+                        "status": self._get_status_string(),
+                        "solver_log": self.solver_log,
+                        "log": self.solver_log,
+                        "error": f"Optimization failed: {self._get_status_string()}",
                     }
 
-            # Solve the problem
-            self._solve_with_logging()
-
-            # Get results
-            if self.prob.status == pulp.LpStatusOptimal:
-                solution = {var: self.variables[var].varValue for var in variable_names}
-                optimal_value = pulp.value(self.prob.objective)
-                # Add the constant term back to the objective value
-                optimal_value += obj_constant
-
-                return {
-                    "success": True,
-                    "status": "optimal",
-                    "solution": solution,
-                    "optimal_value": optimal_value,
-                    "objective_value": optimal_value,
-                    "variables": solution,
-                    "variable_names": variable_names,
-                    "objective_coeffs": obj_coeffs,
-                    "objective_constant": obj_constant,
-                    "constraints": parsed_constraints,
-                    "solver_log": self.solver_log,
-                    "log": self.solver_log,
-                    "is_maximize": is_maximize,
-                    "problem": self.prob,
-                }
-            else:
-                return {
-                    "success": False,
-                    "status": self._get_status_string(),
-                    "solver_log": self.solver_log,
-                    "log": self.solver_log,
-                    "error": f"Optimization failed: {self._get_status_string()}",
-                }
-
-        except Exception as e:
-            return {"success": False, "error": str(e)}
+            except Exception as e:
+                return {"success": False, "error": str(e)}
 
     def _solve_with_logging(self):
-        """Solve the problem and capture solver output"""
-        with tempfile.NamedTemporaryFile(
-            mode="w+", delete=False, suffix=".log"
-        ) as tmp_log:
-            log_path = tmp_log.name
-
-        try:
-            self.prob.solve(pulp.PULP_CBC_CMD(msg=True, logPath=log_path))
-
-            # Read the log file
-            with open(log_path, "r") as f:
-                self.solver_log = f.read()
-        finally:
-            # Clean up the temporary file
-            if os.path.exists(log_path):
-                os.remove(log_path)
+        """Solve the problem and capture solver output in memory"""
+        # Redirect stdout through a pipe instead of a temp file - CBC runs
+        # as a subprocess and inherits the redirected fd, so its output
+        # lands in memory with no disk round trip. A reader thread drains
+        # the pipe so a large log cannot fill the pipe buffer and deadlock.
+        # The redirect swaps the process-global fd 1, so the whole capture
+        # runs under a module lock; note that anything other threads write
+        # to stdout meanwhile (e.g. the app's console log handler) is
+        # captured into this solver log rather than reaching the console.
+        with _STDOUT_CAPTURE_LOCK:
+            read_fd, write_fd = os.pipe()
+            chunks = []
+
+            def _drain():
+                while True:
+                    data = os.read(read_fd, 65536)
+                    if not data:
+                        break
+                    chunks.append(data)
+
+            reader = threading.Thread(target=_drain)
+            reader.start()
+
+            saved_stdout = os.dup(1)
+            try:
+                os.dup2(write_fd, 1)
+                self.prob.solve(
+                    self._cmd
+                    if self._cmd is not None
+                    else pulp.PULP_CBC_CMD(msg=True)
+                )
+            finally:
+                os.dup2(saved_stdout, 1)
+                os.close(saved_stdout)
+                os.close(write_fd)
+                reader.join()
+                os.close(read_fd)
+
+        self.solver_log = b"".join(chunks).decode(errors="replace")
 
     def _get_status_string(self) -> str:
         """Convert PuLP status to string"""
@@ -0,0 +1,65 @@
+"""Race solver that runs HiGHS and PuLP concurrently"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict
+
+from .highs_solver import HiGHSSolver
+from .pulp_solver import PuLPSolver
+
+
+class RaceSolver:
+    """Runs both solvers in parallel and returns the first finisher
+
+    CBC and HiGHS have very different performance envelopes per problem;
+    racing them bounds the wall-clock latency by the faster of the two.
+    Both release the GIL while the underlying C solver runs, so plain
+    threads are enough to overlap them. Each race builds fresh solver
+    instances, so an abandoned losing thread from a previous call can
+    never touch the state of the next race, and the racing solves skip
+    log capture - a race has no single solver log, and HiGHS's display
+    output must not leak into PuLP's stdout-redirected capture.
+    """
+
+    def solve(
+        self, objective_text: str, constraints_text: str, is_maximize: bool
+    ) -> Dict:
+        """
+        Solve the LP problem with both solvers, returning the first result
+
+        Args:
+            objective_text: String representation of objective function
+            constraints_text: String representation of constraints (one per line)
+            is_maximize: Whether to maximize (True) or minimize (False)
+
+        Returns:
+            Dictionary containing solution results from the winning solver
+        """
+        solvers = (HiGHSSolver(), PuLPSolver())
+        executor = ThreadPoolExecutor(max_workers=len(solvers))
+        try:
+            futures = [
+                executor.submit(
+                    solver.solve,
+                    objective_text,
+                    constraints_text,
+                    is_maximize,
+                    include_log=False,
+                )
+                for solver in solvers
+            ]
+            done, pending = wait(futures, return_when=FIRST_COMPLETED)
+            result = done.pop().result()
+
+            if result.get("success") or not pending:
+                return result
+
+            # The first finisher failed - give the slower solver a chance
+            # before reporting the failure
+            done, _ = wait(pending)
+            for future in done:
+                fallback = future.result()
+                if fallback.get("success"):
+                    return fallback
+            return result
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -1,5 +1,6 @@
 """Utility functions for LP optimizer"""
 
-from .parser import parse_objective, parse_constraint
+from .parser import parse_objective, parse_constraint, parse_problem
+from .presolve import detect_status
 
-__all__ = ["parse_objective", "parse_constraint"]
+__all__ = ["parse_objective", "parse_constraint", "parse_problem", "detect_status"]
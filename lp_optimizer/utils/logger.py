@@ -4,9 +4,9 @@ Provides color-coded logging for different components and severity levels.
 """
 
 import logging
+import os
 import sys
 from typing import Optional
-from datetime import datetime
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with color coding for different log levels and components."""
@@ -33,28 +33,71 @@ class ColoredFormatter(logging.Formatter):
     RESET = '\033[0m'
     BOLD = '\033[1m'
     
+    def __init__(self, use_color: bool = True):
+        super().__init__()
+        # Prefix strings are drawn from tiny fixed dicts - build the
+        # ANSI-wrapped forms once instead of re-formatting per record.
+        # When stdout is not a terminal (piped logs, container output),
+        # emit plain prefixes so consumers don't see escape codes.
+        self.use_color = use_color
+        if use_color:
+            self._level_prefix = {
+                level: f"{self.BOLD}{color}[{level:8}]{self.RESET} "
+                for level, color in self.COLORS.items()
+            }
+            self._component_prefix = {
+                component: f"{self.BOLD}{color}[{component:8}]{self.RESET} "
+                for component, color in self.COMPONENT_COLORS.items()
+            }
+        else:
+            self._level_prefix = {
+                level: f"[{level:8}] " for level in self.COLORS
+            }
+            self._component_prefix = {
+                component: f"[{component:8}] " for component in self.COMPONENT_COLORS
+            }
+    
     def format(self, record):
-        # Get component from logger name
-        component = record.name.split('.')[0].upper() if '.' in record.name else 'SYSTEM'
-        
-        # Get colors
-        level_color = self.COLORS.get(record.levelname, self.RESET)
-        component_color = self.COMPONENT_COLORS.get(component, self.RESET)
+        # Get component from logger name; partition stops at the first dot
+        # instead of splitting the whole name. Dotless names now map to
+        # their own component instead of SYSTEM, so "app" renders as APP.
+        component = (record.name.partition('.')[0] or 'SYSTEM').upper()
+        
+        # Cached prefixes; unknown levels/components get a reset-colored
+        # entry added on first sight
+        level_prefix = self._level_prefix.get(record.levelname)
+        if level_prefix is None:
+            level_prefix = self._level_prefix.setdefault(
+                record.levelname,
+                f"{self.BOLD}{self.RESET}[{record.levelname:8}]{self.RESET} "
+                if self.use_color
+                else f"[{record.levelname:8}] ",
+            )
+        component_prefix = self._component_prefix.get(component)
+        if component_prefix is None:
+            component_prefix = self._component_prefix.setdefault(
+                component,
+                f"{self.BOLD}{self.RESET}[{component:8}]{self.RESET} "
+                if self.use_color
+                else f"[{component:8}] ",
+            )
         
-        # Format timestamp
-        timestamp = datetime.fromtimestamp(record.created).strftime('%H:%M:%S.%f')[:-3]
+        # formatTime uses time.strftime and lets logging cache asctime so
+        # a second handler on the same record reuses the conversion
+        timestamp = f"{self.formatTime(record, '%H:%M:%S')}.{int(record.msecs):03d}"
         
         # Build the formatted message
         formatted = (
-            f"{self.BOLD}{level_color}[{record.levelname:8}]{self.RESET} "
-            f"{timestamp} "
-            f"{self.BOLD}{component_color}[{component:8}]{self.RESET} "
-            f"{record.getMessage()}"
+            f"{level_prefix}{timestamp} {component_prefix}{record.getMessage()}"
         )
         
         # Add exception info if present
         if record.exc_info:
-            formatted += f"\n{level_color}{self.formatException(record.exc_info)}{self.RESET}"
+            if self.use_color:
+                level_color = self.COLORS.get(record.levelname, self.RESET)
+                formatted += f"\n{level_color}{self.formatException(record.exc_info)}{self.RESET}"
+            else:
+                formatted += f"\n{self.formatException(record.exc_info)}"
         
         return formatted
 
@@ -62,20 +105,29 @@ class ColoredFormatter(logging.Formatter):
 class LPLogger:
     """Centralized logger factory for LP Optimizer application."""
     
-    _loggers = {}
     _initialized = False
     
     @classmethod
-    def setup(cls, level: str = "DEBUG", log_file: Optional[str] = None):
+    def setup(cls, level: Optional[str] = None, log_file: Optional[str] = None):
         """
         Initialize the logging system.
         
         Args:
-            level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-            log_file: Optional file path to write logs to
+            level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL);
+                defaults to the LOG_LEVEL environment variable, then DEBUG
+            log_file: Optional file path to write logs to; defaults to the
+                LOG_FILE environment variable
+        
+        Calling with no arguments after initialization is a no-op (this is
+        the lazy get_logger path); passing an argument reconfigures the
+        handlers, so an explicit call always takes effect.
         """
-        if cls._initialized:
+        if cls._initialized and level is None and log_file is None:
             return
+        if level is None:
+            level = os.getenv("LOG_LEVEL", "DEBUG")
+        if log_file is None:
+            log_file = os.getenv("LOG_FILE")
         
         # Set up root logger
         root_logger = logging.getLogger()
@@ -84,9 +136,10 @@ class LPLogger:
         # Remove any existing handlers
         root_logger.handlers.clear()
         
-        # Console handler with color formatting
+        # Console handler with color formatting; skip the ANSI codes
+        # when stdout is redirected so piped logs stay clean
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(ColoredFormatter())
+        console_handler.setFormatter(ColoredFormatter(use_color=sys.stdout.isatty()))
         root_logger.addHandler(console_handler)
         
         # File handler if specified (without colors)
@@ -101,13 +154,20 @@ class LPLogger:
         
         cls._initialized = True
         
-        # Log initialization
+        # Log initialization as a single record - one handler pass and
+        # one formatted timestamp instead of five
         logger = cls.get_logger("logger")
-        logger.info("=" * 60)
-        logger.info("LP OPTIMIZER LOGGING SYSTEM INITIALIZED")
-        logger.info(f"Log level: {level}")
-        logger.info(f"Log file: {log_file if log_file else 'Console only'}")
-        logger.info("=" * 60)
+        logger.info(
+            "\n".join(
+                [
+                    "=" * 60,
+                    "LP OPTIMIZER LOGGING SYSTEM INITIALIZED",
+                    f"Log level: {level}",
+                    f"Log file: {log_file if log_file else 'Console only'}",
+                    "=" * 60,
+                ]
+            )
+        )
     
     @classmethod
     def get_logger(cls, name: str) -> logging.Logger:
@@ -123,49 +183,52 @@ class LPLogger:
         if not cls._initialized:
             cls.setup()
         
-        if name not in cls._loggers:
-            cls._loggers[name] = logging.getLogger(name)
-        
-        return cls._loggers[name]
+        # logging.getLogger already caches per-name singletons
+        return logging.getLogger(name)
     
     @classmethod
     def log_function_entry(cls, logger: logging.Logger, func_name: str, **kwargs):
         """Helper to log function entry with parameters."""
+        # Skip the join entirely when debug records would be dropped
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         params = ", ".join(f"{k}={v}" for k, v in kwargs.items())
-        logger.debug(f"→ Entering {func_name}({params if params else ''})")
+        logger.debug("→ Entering %s(%s)", func_name, params)
     
     @classmethod
     def log_function_exit(cls, logger: logging.Logger, func_name: str, result=None):
         """Helper to log function exit with result."""
         if result is not None:
-            logger.debug(f"← Exiting {func_name} with result: {result}")
+            logger.debug("← Exiting %s with result: %s", func_name, result)
         else:
-            logger.debug(f"← Exiting {func_name}")
+            logger.debug("← Exiting %s", func_name)
     
     @classmethod
     def log_callback_registration(cls, logger: logging.Logger, callback_name: str, 
                                  inputs: list, outputs: list, states: list = None):
         """Helper to log callback registration details."""
-        logger.info(f"📌 Registering callback: {callback_name}")
-        logger.debug(f"  Inputs: {inputs}")
-        logger.debug(f"  Outputs: {outputs}")
+        logger.info("📌 Registering callback: %s", callback_name)
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        logger.debug("  Inputs: %s", inputs)
+        logger.debug("  Outputs: %s", outputs)
         if states:
-            logger.debug(f"  States: {states}")
+            logger.debug("  States: %s", states)
     
     @classmethod
     def log_component_creation(cls, logger: logging.Logger, component_name: str, 
                               component_id: str = None):
         """Helper to log UI component creation."""
         if component_id:
-            logger.info(f"🔧 Creating component: {component_name} (ID: {component_id})")
+            logger.info("🔧 Creating component: %s (ID: %s)", component_name, component_id)
         else:
-            logger.info(f"🔧 Creating component: {component_name}")
+            logger.info("🔧 Creating component: %s", component_name)
     
     @classmethod
     def log_error_with_context(cls, logger: logging.Logger, error: Exception, 
                                context: str):
         """Helper to log errors with context."""
-        logger.error(f"❌ Error in {context}: {type(error).__name__}: {str(error)}")
+        logger.error("❌ Error in %s: %s: %s", context, type(error).__name__, error)
         logger.debug("Stack trace:", exc_info=True)
 
 
@@ -174,6 +237,3 @@ def get_logger(name: str) -> logging.Logger:
     """Quick access to get a logger."""
     return LPLogger.get_logger(name)
 
-
-# Initialize on import with default settings
-LPLogger.setup(level="DEBUG")
\ No newline at end of file
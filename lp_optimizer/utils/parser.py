@@ -1,9 +1,16 @@
 """Parser utilities for LP problems"""
 
+import functools
 import re
 from typing import List, Tuple, Dict
 
+# Compiled once at import instead of per call - skips the re module's
+# internal cache lookup on the hot parsing path. Term scanning itself is
+# handled by the regex-free _scan_terms below.
+_PREFIX_RE = re.compile(r"^(Max|Min)\s+Z\s*=\s*", re.IGNORECASE)
 
+
+@functools.lru_cache(maxsize=128)
 def parse_objective(objective_str: str) -> Tuple[Dict[str, float], List[str], float]:
     """
     Parse objective function string like 'Max Z = 3x1 + 2x2 - 5'
@@ -15,46 +22,85 @@ def parse_objective(objective_str: str) -> Tuple[Dict[str, float], List[str], fl
         Tuple of (coefficients dict, variables list, constant term)
     """
     # Remove 'Max' or 'Min' prefix and 'Z =' part
-    clean_str = re.sub(
-        r"^(Max|Min)\s+Z\s*=\s*", "", objective_str.strip(), flags=re.IGNORECASE
-    )
+    clean_str = _PREFIX_RE.sub("", objective_str.strip())
 
-    # Extract variables and coefficients
-    terms = re.findall(r"([+-]?\s*\d*\.?\d*)\s*\*?\s*([a-zA-Z]\w*)", clean_str)
+    # One scan yields both the variable terms and the constant, replacing
+    # the old two-findall-plus-str.replace extraction
+    terms, constant = _scan_terms(clean_str)
 
     coefficients = {}
     variables = []
 
     for coef, var in terms:
-        coef = coef.replace(" ", "")
-        if coef in ["", "+"]:
-            coef = "1"
-        elif coef == "-":
-            coef = "-1"
-        coefficients[var] = float(coef)
+        coefficients[var] = coef
         if var not in variables:
             variables.append(var)
-    
-    # Extract constant term (numbers without variables)
-    # Remove all terms with variables from the string
-    remaining = clean_str
-    for term in re.findall(r"[+-]?\s*\d*\.?\d*\s*\*?\s*[a-zA-Z]\w*", clean_str):
-        remaining = remaining.replace(term, "", 1)
-    
-    # Clean up and find remaining constant
-    remaining = remaining.strip()
-    constant = 0.0
-    
-    if remaining:
-        # Look for standalone numbers (positive or negative)
-        const_match = re.search(r"[+-]?\s*\d+\.?\d*", remaining)
-        if const_match:
-            const_str = const_match.group().replace(" ", "")
-            constant = float(const_str)
 
     return coefficients, variables, constant
 
 
+def _scan_terms(text: str) -> Tuple[List[Tuple[float, str]], float]:
+    """
+    Scan one side of a constraint in a single character pass
+
+    Recognizes signed "[coef][*]var" terms and standalone numeric
+    constants without regex backtracking.
+
+    Args:
+        text: One side of a constraint, e.g. "2x1 + x2" or "3x1 + 5"
+
+    Returns:
+        Tuple of (list of (coefficient, variable) terms, summed constant)
+    """
+    terms = []
+    constant = 0.0
+    i = 0
+    n = len(text)
+
+    while i < n:
+        # Fold leading signs and whitespace into one sign
+        sign = 1.0
+        progressed = False
+        while i < n and (text[i] in "+-" or text[i].isspace()):
+            if text[i] == "-":
+                sign = -sign
+            progressed = True
+            i += 1
+
+        # Optional numeric part
+        num_start = i
+        while i < n and (text[i].isdigit() or text[i] == "."):
+            i += 1
+        num_str = text[num_start:i]
+
+        # Optional whitespace / "*" between coefficient and variable
+        j = i
+        while j < n and text[j].isspace():
+            j += 1
+        if j < n and text[j] == "*":
+            j += 1
+            while j < n and text[j].isspace():
+                j += 1
+
+        if j < n and text[j].isalpha():
+            # Variable name: letter followed by word characters
+            var_start = j
+            j += 1
+            while j < n and (text[j].isalnum() or text[j] == "_"):
+                j += 1
+            coefficient = float(num_str) if num_str else 1.0
+            terms.append((sign * coefficient, text[var_start:j]))
+            i = j
+        elif num_str:
+            # Standalone constant
+            constant += sign * float(num_str)
+        elif not progressed:
+            # Unrecognized character - skip it
+            i += 1
+
+    return terms, constant
+
+
 def parse_constraint(
     constraint_str: str, variables: List[str]
 ) -> Tuple[Dict[str, float], str, float]:
@@ -71,65 +117,74 @@ def parse_constraint(
     Returns:
         Tuple of (coefficients dict, operator, rhs value)
     """
-    # Split by inequality/equality
-    match = re.match(r"(.+?)\s*(<=|>=|=)\s*(.+)", constraint_str)
-    if not match:
+    # Split by inequality/equality in one scan
+    lhs = operator = rhs = None
+    for i, ch in enumerate(constraint_str):
+        if ch in "<>":
+            if constraint_str[i + 1 : i + 2] != "=":
+                raise ValueError(f"Invalid constraint format: {constraint_str}")
+            lhs, operator, rhs = constraint_str[:i], ch + "=", constraint_str[i + 2 :]
+            break
+        if ch == "=":
+            lhs, operator, rhs = constraint_str[:i], "=", constraint_str[i + 1 :]
+            break
+    if operator is None or not lhs.strip() or not rhs.strip():
         raise ValueError(f"Invalid constraint format: {constraint_str}")
 
-    lhs, operator, rhs = match.groups()
-
-    # Parse left-hand side
-    lhs_terms = re.findall(r"([+-]?\s*\d*\.?\d*)\s*\*?\s*([a-zA-Z]\w*)", lhs)
-    
     coefficients = {var: 0.0 for var in variables}
-    
-    # Add LHS variable terms
+
+    # Add LHS variable terms (standalone LHS constants are ignored, as before)
+    lhs_terms, _ = _scan_terms(lhs)
     for coef, var in lhs_terms:
-        coef = coef.replace(" ", "")
-        if coef in ["", "+"]:
-            coef = "1"
-        elif coef == "-":
-            coef = "-1"
-        if var in variables:
-            coefficients[var] = float(coef)
-    
-    # Parse right-hand side for both variables and constants
-    rhs_terms = re.findall(r"([+-]?\s*\d*\.?\d*)\s*\*?\s*([a-zA-Z]\w*)", rhs)
-    rhs_constant = 0.0
-    
-    # Process RHS variable terms (subtract from LHS)
-    for coef, var in rhs_terms:
-        coef = coef.replace(" ", "")
-        if coef in ["", "+"]:
-            coef = "1"
-        elif coef == "-":
-            coef = "-1"
         if var in variables:
-            # Move variable to left side (subtract from existing coefficient)
-            coefficients[var] -= float(coef)
-    
-    # Extract constant term from RHS
-    # Remove all variable terms from RHS to find the constant
-    rhs_remaining = rhs.strip()
-    for term in re.findall(r"[+-]?\s*\d*\.?\d*\s*\*?\s*[a-zA-Z]\w*", rhs):
-        rhs_remaining = rhs_remaining.replace(term, "", 1)
-    
-    # Clean up and find remaining constant
-    rhs_remaining = rhs_remaining.strip()
-    
-    # If there's a standalone number, use it as the constant
-    if rhs_remaining:
-        # Try to parse as a number
-        try:
-            rhs_constant = float(rhs_remaining)
-        except ValueError:
-            # If it's not a valid number, check for patterns like "+5" or "-3"
-            const_match = re.search(r"[+-]?\s*\d+\.?\d*", rhs_remaining)
-            if const_match:
-                rhs_constant = float(const_match.group().replace(" ", ""))
-    else:
-        # If no constant found and only variables, RHS constant is 0
-        # (This handles cases like "x2 >= 3x1" which becomes "x2 - 3x1 >= 0")
-        rhs_constant = 0.0
+            coefficients[var] = coef
+
+    # Fast path: the overwhelmingly common "<expr> op <number>" shape
+    # needs no RHS term scan at all
+    try:
+        rhs_constant = float(rhs)
+    except ValueError:
+        # Process RHS: variable terms move to the left, constants stay right
+        rhs_terms, rhs_constant = _scan_terms(rhs)
+        for coef, var in rhs_terms:
+            if var in variables:
+                coefficients[var] -= coef
 
     return coefficients, operator, rhs_constant
+
+
+@functools.lru_cache(maxsize=64)
+def parse_problem(
+    objective_str: str, constraints_str: str
+) -> Tuple[Dict[str, float], List[str], float, Tuple]:
+    """
+    Parse a full LP problem, memoized on the raw input strings
+
+    Re-solving the same problem (toggling solvers, re-clicking Solve)
+    returns the cached parse without re-running the regex passes.
+
+    Args:
+        objective_str: String representation of objective function
+        constraints_str: String representation of constraints (one per line)
+
+    Returns:
+        Tuple of (coefficients dict, variables list, constant term,
+        tuple of parsed (coefficients, operator, rhs) constraints)
+
+    Raises:
+        ValueError: If a constraint line cannot be parsed; the message
+            names the offending constraint
+    """
+    coefficients, variables, constant = parse_objective(objective_str)
+
+    parsed_constraints = []
+    for line in constraints_str.strip().split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            parsed_constraints.append(parse_constraint(line, variables))
+        except Exception as e:
+            raise ValueError(f"Error parsing constraint '{line}': {str(e)}")
+
+    return coefficients, variables, constant, tuple(parsed_constraints)
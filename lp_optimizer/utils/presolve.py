@@ -0,0 +1,69 @@
+"""Lightweight presolve checks for trivially infeasible or unbounded LPs"""
+
+import functools
+from typing import Optional
+
+from .parser import parse_problem
+
+
+@functools.lru_cache(maxsize=64)
+def detect_status(
+    objective_str: str, constraints_str: str, is_maximize: bool
+) -> Optional[str]:
+    """
+    Detect trivially infeasible or unbounded problems without a solver
+
+    Runs two cheap structural checks on the parsed problem:
+
+    - Contradictory bounds on identical left-hand sides (e.g.
+      "x + y <= 1" together with "x + y >= 2") mean infeasibility.
+    - An objective-improving coordinate ray that no constraint caps
+      (a variable with favorable objective coefficient that appears
+      with the unrestricting sign in every constraint) means the
+      objective is unbounded, assuming a feasible point exists.
+
+    Args:
+        objective_str: String representation of objective function
+        constraints_str: String representation of constraints (one per line)
+        is_maximize: Whether to maximize (True) or minimize (False)
+
+    Returns:
+        "infeasible" or "unbounded" when a trivial certificate is found,
+        None when the checks are inconclusive and a real solve is needed.
+        An "unbounded" verdict only applies if the problem is feasible.
+    """
+    try:
+        obj_coeffs, _, _, parsed_constraints = parse_problem(
+            objective_str, constraints_str
+        )
+    except ValueError:
+        return None
+
+    # Collect the tightest lower/upper bound per distinct left-hand side
+    lower = {}
+    upper = {}
+    for coeffs, op, rhs in parsed_constraints:
+        key = tuple(sorted((var, coef) for var, coef in coeffs.items() if coef))
+        if op != ">=":  # <= and = cap the expression from above
+            upper[key] = min(upper.get(key, rhs), rhs)
+        if op != "<=":  # >= and = bound it from below
+            lower[key] = max(lower.get(key, rhs), rhs)
+    for key, bound in lower.items():
+        if key in upper and bound > upper[key]:
+            return "infeasible"
+
+    # Look for a coordinate direction that improves the objective and is
+    # unrestricted: moving along e_j stays feasible when every constraint
+    # has the unrestricting sign on variable j
+    for var, coef in obj_coeffs.items():
+        if (coef > 0) != is_maximize or coef == 0:
+            continue
+        if all(
+            (op == "<=" and coeffs.get(var, 0) <= 0)
+            or (op == ">=" and coeffs.get(var, 0) >= 0)
+            or (op == "=" and not coeffs.get(var, 0))
+            for coeffs, op, _ in parsed_constraints
+        ):
+            return "unbounded"
+
+    return None
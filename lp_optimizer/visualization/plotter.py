@@ -1,7 +1,8 @@
 """Visualization utilities for LP problems"""
 
-import numpy as np
-import plotly.graph_objects as go
+import functools
+import math
+
 from typing import Dict
 
 from ..config import (
@@ -11,12 +12,43 @@ from ..config import (
     OPTIMAL_POINT_SIZE,
 )
 
+# Imported on first plot - plotly and numpy are only needed once a
+# solution is visualized, so keep them off the app's cold-start path
+np = None
+go = None
+
+
+def _import_plotting():
+    """Load numpy and plotly lazily, rebinding the module globals"""
+    global np, go
+    if go is None:
+        import numpy
+        import plotly.graph_objects
+
+        np = numpy
+        go = plotly.graph_objects
+
+
+@functools.lru_cache(maxsize=8)
+def _grid(x_max: float, resolution: int):
+    """Shared x-axis sample grid, reused across redraws with the same bounds"""
+    grid = np.linspace(0, x_max, resolution)
+    grid.setflags(write=False)
+    return grid
+
+
+# Fill colors precomputed for the first 16 constraints; redraws index the
+# tables instead of re-running arithmetic + f-string formatting per trace
+_LE_COLORS = [f"rgba({50 + i * 30}, {100 + i * 20}, {200 - i * 30}, 0.1)" for i in range(16)]
+_GE_COLORS = [f"rgba({200 - i * 30}, {100 + i * 20}, {50 + i * 30}, 0.1)" for i in range(16)]
+_EQ_COLOR = "rgba(150, 150, 150, 0.1)"
+
 
 class LPPlotter:
     """Create visualizations for linear programming problems"""
 
     @staticmethod
-    def create_feasible_region_plot(result: Dict) -> go.Figure:
+    def create_feasible_region_plot(result: Dict) -> "go.Figure":
         """
         Create visualization for 2-variable LP problems
 
@@ -26,6 +58,8 @@ class LPPlotter:
         Returns:
             Plotly figure object
         """
+        _import_plotting()
+
         if "error" in result or result.get("status") != "optimal":
             return LPPlotter._create_empty_plot("No optimal solution to visualize")
 
@@ -41,18 +75,12 @@ class LPPlotter:
         x_var, y_var = variables[0], variables[1]
 
         # Determine plot bounds
-        x_max = (
-            max(DEFAULT_MAX_BOUND, result["solution"][x_var] * 1.5)
-            if result["solution"][x_var] > 0
-            else DEFAULT_MAX_BOUND
-        )
-        y_max = (
-            max(DEFAULT_MAX_BOUND, result["solution"][y_var] * 1.5)
-            if result["solution"][y_var] > 0
-            else DEFAULT_MAX_BOUND
-        )
+        sx = result["solution"][x_var]
+        sy = result["solution"][y_var]
+        x_max = max(DEFAULT_MAX_BOUND, sx * 1.5) if sx > 0 else DEFAULT_MAX_BOUND
+        y_max = max(DEFAULT_MAX_BOUND, sy * 1.5) if sy > 0 else DEFAULT_MAX_BOUND
 
-        x_range = np.linspace(0, x_max, PLOT_RESOLUTION)
+        x_range = _grid(x_max, PLOT_RESOLUTION)
 
         # Plot constraints
         LPPlotter._add_constraints(fig, result, x_var, y_var, x_range, y_max)
@@ -81,8 +109,9 @@ class LPPlotter:
         return fig
 
     @staticmethod
-    def _create_empty_plot(message: str) -> go.Figure:
+    def _create_empty_plot(message: str) -> "go.Figure":
         """Create empty plot with message"""
+        _import_plotting()
         return go.Figure().add_annotation(
             text=message,
             xref="paper",
@@ -95,28 +124,46 @@ class LPPlotter:
     @staticmethod
     def _add_constraints(fig, result, x_var, y_var, x_range, y_max):
         """Add constraint lines and feasible regions to the plot"""
-        for i, (coeffs, op, rhs) in enumerate(result["constraints"]):
-            a = coeffs[x_var]
-            b = coeffs[y_var]
+        constraints = result["constraints"]
+        coeffs_list = constraints["coeffs"]
+        num_constraints = len(coeffs_list)
+        a_vals = np.fromiter(
+            (c[x_var] for c in coeffs_list), dtype=float, count=num_constraints
+        )
+        b_vals = np.fromiter(
+            (c[y_var] for c in coeffs_list), dtype=float, count=num_constraints
+        )
+        rhs_vals = np.asarray(constraints["rhs"], dtype=float)
+
+        # Rasterize every constraint line in one (N, resolution) broadcast
+        # instead of one vector expression per constraint; rows with b == 0
+        # divide by zero here but are drawn as vertical lines below
+        with np.errstate(divide="ignore", invalid="ignore"):
+            y_lines = (rhs_vals[:, None] - np.outer(a_vals, x_range)) / b_vals[:, None]
+
+        # Shared polygon x-array, filled once for all shaded regions
+        resolution = x_range.shape[0]
+        poly_x = np.empty(2 * resolution)
+        poly_x[:resolution] = x_range
+        poly_x[resolution:] = x_range[::-1]
+
+        for i, op in enumerate(constraints["ops"]):
+            a = a_vals[i]
+            b = b_vals[i]
 
             if b != 0:
-                # y = (rhs - a*x) / b
-                y_line = (rhs - a * x_range) / b
+                y_line = y_lines[i]
 
                 # Determine feasible side
                 if op == "<=":
                     y_fill = np.minimum(y_line, y_max)
-                    fillcolor = (
-                        f"rgba({50 + i * 30}, {100 + i * 20}, {200 - i * 30}, 0.1)"
-                    )
+                    fillcolor = _LE_COLORS[i % 16]
                 elif op == ">=":
                     y_fill = np.maximum(y_line, 0)
-                    fillcolor = (
-                        f"rgba({200 - i * 30}, {100 + i * 20}, {50 + i * 30}, 0.1)"
-                    )
+                    fillcolor = _GE_COLORS[i % 16]
                 else:  # equality
                     y_fill = y_line
-                    fillcolor = f"rgba(150, 150, 150, 0.1)"
+                    fillcolor = _EQ_COLOR
 
                 # Add constraint line
                 fig.add_trace(
@@ -131,15 +178,16 @@ class LPPlotter:
 
                 # Add shaded feasible region
                 if op != "=":
+                    # Fill the polygon y-array in place rather than
+                    # concatenating temporaries; the closing edge is a
+                    # constant (the floor for <=, the ceiling for >=)
+                    poly_y = np.empty(2 * resolution)
+                    poly_y[:resolution] = y_fill
+                    poly_y[resolution:] = 0 if op == "<=" else y_max
                     fig.add_trace(
                         go.Scatter(
-                            x=np.concatenate([x_range, x_range[::-1]]),
-                            y=np.concatenate(
-                                [
-                                    y_fill,
-                                    np.full_like(x_range, 0 if op == "<=" else y_max),
-                                ]
-                            ),
+                            x=poly_x,
+                            y=poly_y,
                             fill="toself",
                             fillcolor=fillcolor,
                             line=dict(width=0),
@@ -149,7 +197,7 @@ class LPPlotter:
                     )
             elif a != 0:
                 # Vertical line constraint: x = rhs/a
-                x_line = rhs / a
+                x_line = rhs_vals[i] / a
                 fig.add_vline(
                     x=x_line, line_dash="dash", annotation_text=f"x = {x_line:.2f}"
                 )
@@ -157,18 +205,18 @@ class LPPlotter:
     @staticmethod
     def _add_optimal_point(fig, result, x_var, y_var):
         """Add the optimal solution point to the plot"""
+        sx = result["solution"][x_var]
+        sy = result["solution"][y_var]
         fig.add_trace(
             go.Scatter(
-                x=[result["solution"][x_var]],
-                y=[result["solution"][y_var]],
+                x=[sx],
+                y=[sy],
                 mode="markers+text",
                 name="Optimal Solution",
                 marker=dict(
                     size=OPTIMAL_POINT_SIZE, color=OPTIMAL_POINT_COLOR, symbol="star"
                 ),
-                text=[
-                    f"({result['solution'][x_var]:.2f}, {result['solution'][y_var]:.2f})"
-                ],
+                text=[f"({sx:.2f}, {sy:.2f})"],
                 textposition="top right",
             )
         )
@@ -176,21 +224,24 @@ class LPPlotter:
     @staticmethod
     def _add_objective_direction(fig, result, x_var, y_var):
         """Add arrow showing objective function gradient direction"""
-        obj_a = result["objective_coeffs"][x_var]
-        obj_b = result["objective_coeffs"][y_var]
+        obj_coeffs = result["objective_coeffs"]
+        obj_a = obj_coeffs[x_var]
+        obj_b = obj_coeffs[y_var]
+        sx = result["solution"][x_var]
+        sy = result["solution"][y_var]
 
-        # Normalize gradient
-        grad_norm = np.sqrt(obj_a**2 + obj_b**2)
+        # Normalize gradient (math.hypot stays scalar - no 0-d array)
+        grad_norm = math.hypot(obj_a, obj_b)
         if grad_norm > 0:
             grad_x = obj_a / grad_norm * 3
             grad_y = obj_b / grad_norm * 3
 
             # Add gradient arrow
             fig.add_annotation(
-                x=result["solution"][x_var] + grad_x,
-                y=result["solution"][y_var] + grad_y,
-                ax=result["solution"][x_var],
-                ay=result["solution"][y_var],
+                x=sx + grad_x,
+                y=sy + grad_y,
+                ax=sx,
+                ay=sy,
                 xref="x",
                 yref="y",
                 axref="x",
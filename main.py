@@ -7,16 +7,16 @@ with an intuitive interface.
 
 import os
 from dotenv import load_dotenv
-from lp_optimizer.app import create_app
-from lp_optimizer.utils.logger import LPLogger, get_logger
 
-# Load environment variables from .env file
+# Load environment variables before importing the app: importing it
+# triggers logger setup, which reads LOG_LEVEL/LOG_FILE
 load_dotenv()
 
-# Initialize logging system
-log_level = os.getenv("LOG_LEVEL", "DEBUG")
-log_file = os.getenv("LOG_FILE", None)
-LPLogger.setup(level=log_level, log_file=log_file)
+from lp_optimizer.app import create_app
+from lp_optimizer.utils.logger import LPLogger, get_logger
+
+# Initialize logging system (reads LOG_LEVEL/LOG_FILE from environment)
+LPLogger.setup()
 
 # Get logger for main module
 logger = get_logger("main")
@@ -25,8 +25,8 @@ logger = get_logger("main")
 def main():
     """Run the LP optimizer application"""
     logger.info("Starting LP Optimizer Application")
-    logger.debug(f"Python path: {os.sys.executable}")
-    logger.debug(f"Working directory: {os.getcwd()}")
+    logger.debug("Python path: %s", os.sys.executable)
+    logger.debug("Working directory: %s", os.getcwd())
     
     # Create the app
     logger.info("Creating Dash application...")
@@ -37,15 +37,14 @@ def main():
     debug = os.getenv("DASH_DEBUG", "True").lower() == "true"
     port = int(os.getenv("PORT", "8050"))
     
-    logger.info(f"Configuration:")
-    logger.info(f"  Debug mode: {debug}")
-    logger.info(f"  Port: {port}")
-    logger.info(f"  Host: 0.0.0.0")
-
-    # Run the server
-    logger.info("=" * 60)
-    logger.info(f"🚀 Starting server on http://0.0.0.0:{port}")
-    logger.info("=" * 60)
+    logger.info(
+        "Configuration:\n  Debug mode: %s\n  Port: %s\n  Host: 0.0.0.0", debug, port
+    )
+
+    # Run the server - banner batched into one record
+    logger.info(
+        "\n".join(["=" * 60, f"🚀 Starting server on http://0.0.0.0:{port}", "=" * 60])
+    )
     
     try:
         app.run(debug=debug, host="0.0.0.0", port=port)
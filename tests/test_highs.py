@@ -27,11 +27,12 @@ if result.get("success"):
     for var, value in result['solution'].items():
         print(f"  {var} = {value:.2f}")
     print(f"\nEnd-of-week stock: {result['optimal_value']:.2f} units")
-    print(f"HiGHS iterations: {result['solver_log'].split('Iterations: ')[1].split('\\n')[0]}")
+    iterations = result['solver_log'].split('Iterations: ')[1].splitlines()[0]
+    print(f"HiGHS iterations: {iterations}")
 else:
     print(f"✗ Optimization failed: {result.get('error', 'Unknown error')}")
     print(f"Status: {result.get('status', 'Unknown')}")
 
-# Test that the mock problem object works
-if result.get("success") and result.get("problem"):
-    print(f"\n✓ Mock problem object created with {len(result['problem'].variables())} variables")
\ No newline at end of file
+# Variable names are exposed as a plain list
+if result.get("success"):
+    print(f"\n✓ Solved for {len(result['variable_names'])} variables")
\ No newline at end of file
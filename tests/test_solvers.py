@@ -1,19 +1,76 @@
 #!/usr/bin/env python3
 """Comprehensive test suite for LP solvers"""
 
+import functools
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pulp
+
 from lp_optimizer.solvers.pulp_solver import PuLPSolver
 from lp_optimizer.solvers.highs_solver import HiGHSSolver
+from lp_optimizer.utils.presolve import detect_status
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_solve(solver, objective, constraints, is_maximize):
+    """Solve once per unique (solver, problem) and reuse the result
+    
+    Several tests solve identical tiny LPs; caching turns the repeats
+    into dict lookups instead of fresh CBC/HiGHS invocations. Cached
+    results are shared - tests must treat them as read-only. Logs are
+    skipped here; test_solver_specific_features calls solve() directly
+    for the full payload.
+    """
+    return solver.solve(objective, constraints, is_maximize, include_log=False)
+
+
+# Reference optima as frozen module-level arrays, laid out as
+# [*solution values in key order, optimal value]; built once at import
+# so each comparison is a single allclose over a ready-made ndarray
+_XY_KEYS = ("x", "y")
+_EXAMPLE_EXPECTED = np.array([45.0, 6.25, 51.25])
+_SIMPLE_MAX_EXPECTED = np.array([1.0, 3.0, 9.0])
+_SIMPLE_MIN_EXPECTED = np.array([2.0, 1.0, 7.0])
+_NEGATIVE_COEFF_EXPECTED = np.array([10.0, 0.0, 50.0])
 
 
 class TestLPSolvers(unittest.TestCase):
     """Test cases for both PuLP and HiGHS solvers"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.pulp_solver = PuLPSolver()
-        self.highs_solver = HiGHSSolver()
-        self.tolerance = 1e-4
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures
+        
+        The solver wrappers are stateless between solve() calls (each call
+        resets its own state), so one instance per class is enough instead
+        of a fresh pair per test method.
+        """
+        # Silence CBC so each solve skips generating and capturing the
+        # progress log the tests never read
+        cls.pulp_solver = PuLPSolver(cmd=pulp.PULP_CBC_CMD(msg=False))
+        cls.highs_solver = HiGHSSolver()
+        cls.solvers = {"pulp": cls.pulp_solver, "highs": cls.highs_solver}
+        cls.tolerance = 1e-4
+    
+    def _assert_matches(self, result, keys, expected, atol):
+        """Assert an optimal result matches a reference array in one comparison
+        
+        expected holds the solution values in key order followed by the
+        optimal value (see the module-level _*_EXPECTED constants).
+        """
+        self.assertTrue(result['success'])
+        self.assertEqual(result['status'], 'optimal')
+        got = np.fromiter(
+            (result['solution'][k] for k in keys), dtype=np.float64, count=len(keys)
+        )
+        np.testing.assert_allclose(
+            np.append(got, result['optimal_value']),
+            expected,
+            atol=atol,
+            err_msg=f"Result differs from reference on {list(keys) + ['optimal_value']}",
+        )
     
     def test_example_problem(self):
         """Test the example problem from the documentation"""
@@ -23,28 +80,13 @@ class TestLPSolvers(unittest.TestCase):
 x >= 45
 y >= 5"""
         
-        # Test PuLP
-        pulp_result = self.pulp_solver.solve(objective, constraints, is_maximize=True)
-        self.assertTrue(pulp_result['success'])
-        self.assertEqual(pulp_result['status'], 'optimal')
-        self.assertAlmostEqual(pulp_result['optimal_value'], 51.25, places=2)
-        self.assertAlmostEqual(pulp_result['solution']['x'], 45.0, places=2)
-        self.assertAlmostEqual(pulp_result['solution']['y'], 6.25, places=2)
-        
-        # Test HiGHS
-        highs_result = self.highs_solver.solve(objective, constraints, is_maximize=True)
-        self.assertTrue(highs_result['success'])
-        self.assertEqual(highs_result['status'], 'optimal')
-        self.assertAlmostEqual(highs_result['optimal_value'], 51.25, places=2)
-        self.assertAlmostEqual(highs_result['solution']['x'], 45.0, places=2)
-        self.assertAlmostEqual(highs_result['solution']['y'], 6.25, places=2)
-        
-        # Compare results
-        self.assertAlmostEqual(
-            pulp_result['optimal_value'], 
-            highs_result['optimal_value'], 
-            delta=self.tolerance
-        )
+        # Both solvers checked against the same reference; matching the
+        # reference implies they match each other, so the old cross-solver
+        # comparison is redundant
+        for name, solver in self.solvers.items():
+            with self.subTest(solver=name):
+                result = _cached_solve(solver, objective, constraints, True)
+                self._assert_matches(result, _XY_KEYS, _EXAMPLE_EXPECTED, atol=1e-2)
     
     def test_simple_maximization(self):
         """Test a simple maximization problem"""
@@ -54,14 +96,13 @@ y >= 5"""
 x >= 0
 y >= 0"""
         
-        for solver in [self.pulp_solver, self.highs_solver]:
-            result = solver.solve(objective, constraints, is_maximize=True)
-            self.assertTrue(result['success'])
-            self.assertEqual(result['status'], 'optimal')
-            # Optimal solution should be x=1, y=3 with value 9
-            self.assertAlmostEqual(result['optimal_value'], 9.0, delta=self.tolerance)
-            self.assertAlmostEqual(result['solution']['x'], 1.0, delta=self.tolerance)
-            self.assertAlmostEqual(result['solution']['y'], 3.0, delta=self.tolerance)
+        for name, solver in self.solvers.items():
+            with self.subTest(solver=name):
+                result = _cached_solve(solver, objective, constraints, True)
+                # Optimal solution should be x=1, y=3 with value 9
+                self._assert_matches(
+                    result, _XY_KEYS, _SIMPLE_MAX_EXPECTED, atol=self.tolerance
+                )
     
     def test_simple_minimization(self):
         """Test a simple minimization problem"""
@@ -71,14 +112,13 @@ x + y >= 3
 x >= 0
 y >= 0"""
         
-        for solver in [self.pulp_solver, self.highs_solver]:
-            result = solver.solve(objective, constraints, is_maximize=False)
-            self.assertTrue(result['success'])
-            self.assertEqual(result['status'], 'optimal')
-            # Optimal solution should be x=2, y=1 with value 7
-            self.assertAlmostEqual(result['optimal_value'], 7.0, delta=self.tolerance)
-            self.assertAlmostEqual(result['solution']['x'], 2.0, delta=self.tolerance)
-            self.assertAlmostEqual(result['solution']['y'], 1.0, delta=self.tolerance)
+        for name, solver in self.solvers.items():
+            with self.subTest(solver=name):
+                result = _cached_solve(solver, objective, constraints, False)
+                # Optimal solution should be x=2, y=1 with value 7
+                self._assert_matches(
+                    result, _XY_KEYS, _SIMPLE_MIN_EXPECTED, atol=self.tolerance
+                )
     
     def test_infeasible_problem(self):
         """Test an infeasible problem"""
@@ -88,10 +128,14 @@ x + y >= 2
 x >= 0
 y >= 0"""
         
-        for solver in [self.pulp_solver, self.highs_solver]:
-            result = solver.solve(objective, constraints, is_maximize=True)
-            self.assertFalse(result['success'])
-            self.assertIn(result['status'], ['infeasible', 'not_solved'])
+        # The microsecond presolve should certify this without a solver
+        self.assertEqual(detect_status(objective, constraints, True), "infeasible")
+        
+        for name, solver in self.solvers.items():
+            with self.subTest(solver=name):
+                result = _cached_solve(solver, objective, constraints, True)
+                self.assertFalse(result['success'])
+                self.assertIn(result['status'], ['infeasible', 'not_solved'])
     
     def test_unbounded_problem(self):
         """Test an unbounded problem"""
@@ -100,14 +144,18 @@ y >= 0"""
 x >= 0
 y >= 0"""
         
-        for solver in [self.pulp_solver, self.highs_solver]:
-            result = solver.solve(objective, constraints, is_maximize=True)
-            # Some solvers might find a large solution rather than detecting unboundedness
-            if result['success']:
-                # If it found a solution, it should be very large
-                self.assertGreater(result['optimal_value'], 1000)
-            else:
-                self.assertEqual(result['status'], 'unbounded')
+        # The presolve ray check should certify unboundedness directly
+        self.assertEqual(detect_status(objective, constraints, True), "unbounded")
+        
+        for name, solver in self.solvers.items():
+            with self.subTest(solver=name):
+                result = _cached_solve(solver, objective, constraints, True)
+                # Some solvers might find a large solution rather than detecting unboundedness
+                if result['success']:
+                    # If it found a solution, it should be very large
+                    self.assertGreater(result['optimal_value'], 1000)
+                else:
+                    self.assertEqual(result['status'], 'unbounded')
     
     def test_equality_constraints(self):
         """Test problem with equality constraints"""
@@ -117,16 +165,17 @@ y >= 0"""
 x >= 0
 y >= 0"""
         
-        for solver in [self.pulp_solver, self.highs_solver]:
-            result = solver.solve(objective, constraints, is_maximize=True)
-            self.assertTrue(result['success'])
-            self.assertEqual(result['status'], 'optimal')
-            # Solution should satisfy x + y = 10
-            self.assertAlmostEqual(
-                result['solution']['x'] + result['solution']['y'], 
-                10.0, 
-                delta=self.tolerance
-            )
+        for name, solver in self.solvers.items():
+            with self.subTest(solver=name):
+                result = _cached_solve(solver, objective, constraints, True)
+                self.assertTrue(result['success'])
+                self.assertEqual(result['status'], 'optimal')
+                # Solution should satisfy x + y = 10
+                self.assertAlmostEqual(
+                    result['solution']['x'] + result['solution']['y'], 
+                    10.0, 
+                    delta=self.tolerance
+                )
     
     def test_negative_coefficients(self):
         """Test problem with negative coefficients"""
@@ -136,14 +185,13 @@ y >= 0"""
 x >= 0
 y >= 0"""
         
-        for solver in [self.pulp_solver, self.highs_solver]:
-            result = solver.solve(objective, constraints, is_maximize=True)
-            self.assertTrue(result['success'])
-            self.assertEqual(result['status'], 'optimal')
-            # Optimal solution should be x=10, y=0 with value 50
-            self.assertAlmostEqual(result['optimal_value'], 50.0, delta=self.tolerance)
-            self.assertAlmostEqual(result['solution']['x'], 10.0, delta=self.tolerance)
-            self.assertAlmostEqual(result['solution']['y'], 0.0, delta=self.tolerance)
+        for name, solver in self.solvers.items():
+            with self.subTest(solver=name):
+                result = _cached_solve(solver, objective, constraints, True)
+                # Optimal solution should be x=10, y=0 with value 50
+                self._assert_matches(
+                    result, _XY_KEYS, _NEGATIVE_COEFF_EXPECTED, atol=self.tolerance
+                )
     
     def test_multiple_variables(self):
         """Test problem with more than 2 variables"""
@@ -155,13 +203,18 @@ x >= 0
 y >= 0
 z >= 0"""
         
-        for solver in [self.pulp_solver, self.highs_solver]:
-            result = solver.solve(objective, constraints, is_maximize=True)
-            self.assertTrue(result['success'])
-            self.assertEqual(result['status'], 'optimal')
-            # Verify all variables are non-negative
-            for var in ['x', 'y', 'z']:
-                self.assertGreaterEqual(result['solution'][var], -self.tolerance)
+        for name, solver in self.solvers.items():
+            with self.subTest(solver=name):
+                result = _cached_solve(solver, objective, constraints, True)
+                self.assertTrue(result['success'])
+                self.assertEqual(result['status'], 'optimal')
+                # Verify all variables are non-negative in one array check
+                values = np.fromiter(
+                    (result['solution'][var] for var in ['x', 'y', 'z']),
+                    dtype=np.float64,
+                    count=3,
+                )
+                self.assertGreaterEqual(values.min(), -self.tolerance)
     
     def test_solver_specific_features(self):
         """Test solver-specific return values"""
@@ -178,61 +231,58 @@ y >= 0"""
         
         # Test HiGHS specific features
         highs_result = self.highs_solver.solve(objective, constraints, is_maximize=True)
-        self.assertIn('problem', highs_result)
         self.assertIn('log', highs_result)
-        # Mock problem should have variables method
-        self.assertTrue(hasattr(highs_result['problem'], 'variables'))
-        self.assertTrue(callable(highs_result['problem'].variables))
+        # Variable names are exposed as a plain sorted list
+        self.assertEqual(highs_result['variable_names'], ['x', 'y'])
     
     def test_error_handling(self):
         """Test error handling for malformed inputs"""
         # Test invalid objective
-        for solver in [self.pulp_solver, self.highs_solver]:
-            result = solver.solve("invalid objective", "x >= 0", True)
-            self.assertFalse(result['success'])
-            self.assertIn('error', result)
+        for name, solver in self.solvers.items():
+            with self.subTest(solver=name):
+                result = _cached_solve(solver, "invalid objective", "x >= 0", True)
+                self.assertFalse(result['success'])
+                self.assertIn('error', result)
         
         # Test invalid constraints
-        for solver in [self.pulp_solver, self.highs_solver]:
-            result = solver.solve("x + y", "invalid constraint", True)
-            self.assertFalse(result['success'])
-            self.assertIn('error', result)
+        for name, solver in self.solvers.items():
+            with self.subTest(solver=name):
+                result = _cached_solve(solver, "x + y", "invalid constraint", True)
+                self.assertFalse(result['success'])
+                self.assertIn('error', result)
 
 
 class TestSolverConsistency(unittest.TestCase):
     """Test that both solvers produce consistent results"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.pulp_solver = PuLPSolver()
-        self.highs_solver = HiGHSSolver()
-        self.tolerance = 1e-3
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures"""
+        cls.pulp_solver = PuLPSolver(cmd=pulp.PULP_CBC_CMD(msg=False))
+        cls.highs_solver = HiGHSSolver()
+        cls.tolerance = 1e-3
     
-    def compare_results(self, objective, constraints, is_maximize):
-        """Helper to compare results from both solvers"""
-        pulp_result = self.pulp_solver.solve(objective, constraints, is_maximize)
-        highs_result = self.highs_solver.solve(objective, constraints, is_maximize)
-        
+    def compare_results(self, pulp_result, highs_result):
+        """Helper to compare pre-solved results from both solvers"""
         # Both should succeed or both should fail
         self.assertEqual(pulp_result['success'], highs_result['success'])
         
         if pulp_result['success'] and highs_result['success']:
-            # Compare optimal values
-            self.assertAlmostEqual(
-                pulp_result['optimal_value'],
-                highs_result['optimal_value'],
-                delta=self.tolerance,
-                msg=f"Optimal values differ: PuLP={pulp_result['optimal_value']}, HiGHS={highs_result['optimal_value']}"
+            # Compare optimal value and every variable in one vectorized
+            # check instead of a per-element assertAlmostEqual loop
+            keys = sorted(pulp_result['solution'])
+            pulp_values = np.fromiter(
+                (pulp_result['solution'][k] for k in keys), dtype=np.float64
+            )
+            highs_values = np.fromiter(
+                (highs_result['solution'][k] for k in keys), dtype=np.float64
+            )
+            np.testing.assert_allclose(
+                np.append(pulp_values, pulp_result['optimal_value']),
+                np.append(highs_values, highs_result['optimal_value']),
+                atol=self.tolerance,
+                err_msg=f"Solver results differ on {keys + ['optimal_value']}",
             )
-            
-            # Compare solutions
-            for var in pulp_result['solution']:
-                self.assertAlmostEqual(
-                    pulp_result['solution'][var],
-                    highs_result['solution'][var],
-                    delta=self.tolerance,
-                    msg=f"Variable {var} differs: PuLP={pulp_result['solution'][var]}, HiGHS={highs_result['solution'][var]}"
-                )
     
     def test_consistency_basic_problems(self):
         """Test consistency on basic problems"""
@@ -243,9 +293,27 @@ class TestSolverConsistency(unittest.TestCase):
             ("3x + 4y + 2z", "x + y + z <= 10\n2x + y <= 15\nx >= 0\ny >= 0\nz >= 0", True),
         ]
         
-        for objective, constraints, is_maximize in test_cases:
+        # Solve all cases up front with one worker per solver - each
+        # wrapper instance carries per-solve state, so a single thread
+        # drives each solver through its cases while the two solvers
+        # overlap (CBC in a subprocess, HiGHS in native code that
+        # releases the GIL). subTest then only does assertions.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(
+                    lambda s=solver: [
+                        _cached_solve(s, o, c, m) for o, c, m in test_cases
+                    ]
+                )
+                for solver in (self.pulp_solver, self.highs_solver)
+            ]
+            pulp_results, highs_results = (f.result() for f in futures)
+        
+        for (objective, _, _), pulp_result, highs_result in zip(
+            test_cases, pulp_results, highs_results
+        ):
             with self.subTest(objective=objective):
-                self.compare_results(objective, constraints, is_maximize)
+                self.compare_results(pulp_result, highs_result)
 
 
 if __name__ == '__main__':